@@ -4,10 +4,23 @@ Career Profile API Server
 Provides REST API endpoints for the Dynamic Multi-Profile System
 """
 
+import hashlib
 import os
 import sys
-from flask import Flask, request, jsonify
+import threading
+import time
+import uuid
+from collections import defaultdict
+from functools import wraps
+import fastjsonschema
+import orjson
+from fastjsonschema import JsonSchemaException
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
+from werkzeug.serving import WSGIRequestHandler
 from profile_data_manager import ProfileDataManager, ProfileAPI
 import logging
 
@@ -15,217 +28,459 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+MAX_CONTENT_LENGTH = 2 * 1024 * 1024  # 2MB, profile payloads are far smaller
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson instead of the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's UTF-8 bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype="application/json")
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
 CORS(app)
+Compress(app)
+
+_SETTINGS_READS = ('get_global_settings', 'get_personal_data')
+_PROFILE_READS = ('list_profiles', 'get_profile', 'get_active_profile')
+
+
+class CachedProfileAPI(ProfileAPI):
+    """ProfileAPI with memoized reads; each write clears the reads it can affect"""
+
+    _MEMO_SIZE = 128
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._memo_lock = threading.Lock()
+        self._generations = defaultdict(int)
+        for name in _SETTINGS_READS + _PROFILE_READS:
+            setattr(self, name, self._memoize(name, getattr(self, name)))
+
+    def _memoize(self, name, fn):
+        """Cache *fn* by its arguments; results of reads that overlapped a write are not stored"""
+        memo = {}
+
+        @wraps(fn)
+        def read(*args):
+            try:
+                return memo[args]
+            except KeyError:
+                pass
+            generation = self._generations[name]
+            result = fn(*args)
+            with self._memo_lock:
+                # A write that started meanwhile bumped the generation, so result may be stale
+                if self._generations[name] == generation:
+                    if len(memo) >= self._MEMO_SIZE:
+                        memo.pop(next(iter(memo)))
+                    memo[args] = result
+            return result
+
+        read.cache_clear = memo.clear
+        return read
+
+    def _invalidate_reads(self, reads):
+        with self._memo_lock:
+            for name in reads:
+                self._generations[name] += 1
+                getattr(self, name).cache_clear()
+
+    def _write(self, reads, method, *args):
+        # Invalidate before as well as after: a write that reads through self never
+        # mutates a memoized result, and no read overlapping the write gets stored
+        self._invalidate_reads(reads)
+        try:
+            return method(*args)
+        finally:
+            self._invalidate_reads(reads)
+
+    def update_global_settings(self, data):
+        return self._write(_SETTINGS_READS, super().update_global_settings, data)
+
+    def update_personal_data(self, data):
+        return self._write(_SETTINGS_READS, super().update_personal_data, data)
+
+    def create_profile(self, data):
+        return self._write(_PROFILE_READS, super().create_profile, data)
+
+    def update_profile(self, profile_name, data):
+        return self._write(_PROFILE_READS, super().update_profile, profile_name, data)
+
+    def delete_profile(self, profile_name):
+        return self._write(_PROFILE_READS, super().delete_profile, profile_name)
+
+    def set_active_profile(self, profile_name):
+        return self._write(_PROFILE_READS, super().set_active_profile, profile_name)
+
+    def deactivate_profile(self):
+        return self._write(_PROFILE_READS, super().deactivate_profile)
+
 
 # Initialize Profile API
-profile_api = ProfileAPI()
+profile_api = CachedProfileAPI()
 
-@app.route('/api/settings/global', methods=['GET'])
-def get_global_settings():
-    """GET /api/settings/global"""
-    try:
-        result = profile_api.get_global_settings()
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in get_global_settings: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/settings/global', methods=['PUT'])
-def update_global_settings():
-    """PUT /api/settings/global"""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({
-                "success": False,
-                "message": "No data provided"
-            }), 400
-        
-        result = profile_api.update_global_settings(data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in update_global_settings: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/settings/personal', methods=['GET'])
-def get_personal_data():
-    """GET /api/settings/personal"""
-    try:
-        result = profile_api.get_personal_data()
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in get_personal_data: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/settings/personal', methods=['PUT'])
-def update_personal_data():
-    """PUT /api/settings/personal"""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({
-                "success": False,
-                "message": "No data provided"
-            }), 400
-        
-        result = profile_api.update_personal_data(data)
+# Bound once here so hand-written handlers skip the attribute lookup per request;
+# the route tables below store bound methods as well
+_list_profiles = profile_api.list_profiles
+_create_profile = profile_api.create_profile
+_update_profile = profile_api.update_profile
+_delete_profile = profile_api.delete_profile
+_get_profile_template = profile_api.get_profile_template
+
+def _json_body():
+    """Parse the request body once; later accesses reuse Flask's cached result"""
+    return request.get_json(cache=True, silent=True)
+
+# Response cache: pre-serialized GET bodies keyed by "{resource}:{key}:{version}".
+# Every write bumps the resource version and purges its entries, so reads never
+# see stale data written through this server.
+_cache_lock = threading.Lock()
+_cache_versions = defaultdict(int)
+_response_cache = {}
+
+# Versions restart at 0 with the process, so ETags carry a per-boot token
+# and Last-Modified falls back to the server start time
+_BOOT_ID = uuid.uuid4().hex[:8]
+_BOOT_TIME = time.time()
+_cache_mtimes = defaultdict(lambda: _BOOT_TIME)
+
+def _etag_matches(etag):
+    """If-None-Match check that ignores the ":br"/":gzip" suffix Flask-Compress appends"""
+    return any(tag.split(':', 1)[0] == etag for tag in request.if_none_match.as_set(include_weak=True))
+
+def _cached_response(resource, key, producer, *args):
+    """Serve a GET body from the response cache, computing it on a miss"""
+    version = _cache_versions[resource]
+    etag = f"{resource}-{_BOOT_ID}-{version}"
+    if _etag_matches(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+
+    cache_key = f"{resource}:{key}:{version}"
+    body = _response_cache.get(cache_key)
+    if body is None:
+        result = producer(*args)
+        body = orjson.dumps(result, option=ORJSON_OPTIONS)
+        if isinstance(result, dict) and not result.get("success", True):
+            # Errors are neither cached nor validated, they are recomputed next time
+            return app.response_class(body, mimetype="application/json")
+        with _cache_lock:
+            # A write that landed while we were reading makes this body stale
+            if _cache_versions[resource] == version:
+                _response_cache[cache_key] = body
+
+    response = app.response_class(body, mimetype="application/json")
+    response.set_etag(etag, weak=True)
+    response.last_modified = _cache_mtimes[resource]
+    return response.make_conditional(request)
+
+def _invalidate(resource):
+    """Bump the version of *resource*, drop its cached responses and return the new version"""
+    prefix = f"{resource}:"
+    with _cache_lock:
+        _cache_versions[resource] += 1
+        _cache_mtimes[resource] = time.time()
+        for cache_key in [k for k in _response_cache if k.startswith(prefix)]:
+            del _response_cache[cache_key]
+        return _cache_versions[resource]
+
+def api_route(fn):
+    """Serialize a handler's result; unexpected errors go to handle_unexpected_error"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        result = fn(*args, **kwargs)
+        if isinstance(result, (Response, tuple)):
+            return result
         return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in update_personal_data: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
+    return wrapper
+
+def _ndjson(rows):
+    """Encode rows lazily so the first bytes go out before the last row is encoded"""
+    for row in rows:
+        yield orjson.dumps(row, option=ORJSON_OPTIONS) + b"\n"
+
+# Pre-encoded error bodies; exception details are logged, never sent to clients
+_ERR_400_NO_DATA = b'{"success":false,"message":"No data provided"}'
+_ERR_413 = b'{"success":false,"message":"Payload too large"}'
+_ERR_500 = b'{"success":false,"message":"Server error"}'
+# Validation errors carry the schema message, so only the fixed part is pre-encoded
+_ERR_400_INVALID_PREFIX = b'{"success":false,"message":'
+
+def _error(body, status):
+    return app.response_class(body, status=status, mimetype="application/json")
+
+def _no_data():
+    return _error(_ERR_400_NO_DATA, 400)
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Single fallback for errors raised by any route"""
+    if isinstance(e, HTTPException):
+        return e
+    logger.exception("Error in %s", request.endpoint)
+    return _error(_ERR_500, 500)
+
+@app.before_request
+def reject_oversized_body():
+    """Reject oversized payloads before get_json() reads and parses them"""
+    if request.content_length is not None and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+        return _error(_ERR_413, 413)
+
+def _read_view(resource, key, fn):
+    """Build a cached GET view; *key* is formatted with the URL arguments"""
+    def view(**kwargs):
+        return _cached_response(resource, key.format(**kwargs), fn, *kwargs.values())
+    return view
+
+# Request body schemas, compiled to plain Python once at import time
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_PROFILE_PROPERTIES = {
+    "profile_name": {"type": "string", "minLength": 1},
+    "description": {"type": "string"},
+    "skills": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "level": {"enum": ["Grundlagen", "Fortgeschritten", "Experte"]},
+                "examples": _STRING_LIST
+            }
+        }
+    },
+    "experiences": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "description": {"type": "string"},
+                "examples": _STRING_LIST
+            }
+        }
+    }
+}
+_PERSONAL_DATA_SCHEMA = {
+    "type": "object",
+    "properties": {field: {"type": "string"} for field in ("name", "address", "city", "phone", "email")}
+}
+
+validate_create_profile = fastjsonschema.compile({
+    "type": "object", "required": ["profile_name"], "properties": _PROFILE_PROPERTIES
+})
+validate_update_profile = fastjsonschema.compile({"type": "object", "properties": _PROFILE_PROPERTIES})
+validate_personal_data = fastjsonschema.compile(_PERSONAL_DATA_SCHEMA)
+validate_global_settings = fastjsonschema.compile({
+    "type": "object", "properties": {"personal_data": _PERSONAL_DATA_SCHEMA}
+})
+
+def _invalid_data(e):
+    return _error(_ERR_400_INVALID_PREFIX + orjson.dumps(f"Invalid data: {e.message}") + b'}', 400)
+
+# Last successful PUT per URL: (body signature, resource version after the write, response body)
+_write_signatures = {}
+# Writes to one resource run one at a time, so a PUT's signature check, write and
+# recorded version can't interleave with another write to the same resource
+_write_locks = defaultdict(threading.Lock)
+
+def _write_view(resource, fn, validator, idempotent=False):
+    """Build a mutating view that invalidates *resource* after the write
+
+    Views with a *validator* take a JSON body and reject it with a 400 unless it
+    matches the schema; views without one take no body.
+
+    Idempotent (PUT) views skip the write entirely when the body matches the
+    last one written to the same URL and the resource has not changed since.
+    """
+    write_lock = _write_locks[resource]
+
+    def view(**kwargs):
+        args = list(kwargs.values())
+        signature = None
+        if validator is not None:
+            data = _json_body()
+            if not data:
+                return _no_data()
+            try:
+                validator(data)
+            except JsonSchemaException as e:
+                return _invalid_data(e)
+            args.append(data)
+            if idempotent:
+                signature = hashlib.blake2b(request.get_data(), digest_size=16).digest()
+        with write_lock:
+            version = _cache_versions[resource]
+            if signature is not None:
+                previous = _write_signatures.get(request.path)
+                if previous and previous[0] == signature and previous[1] == version:
+                    return app.response_class(previous[2], mimetype="application/json")
+            result = fn(*args)
+            new_version = _invalidate(resource)
+            body = orjson.dumps(result, option=ORJSON_OPTIONS)
+            if signature is not None and isinstance(result, dict) and result.get("success", False):
+                if new_version == version + 1:
+                    _write_signatures[request.path] = (signature, new_version, body)
+                else:
+                    # Another writer bumped the version too, so new_version may not be ours alone
+                    _write_signatures.pop(request.path, None)
+        return app.response_class(body, mimetype="application/json")
+    return view
+
+# (rule, resource, cache key, ProfileAPI method)
+READ_ROUTES = [
+    ('/api/settings/global', 'settings', 'global', profile_api.get_global_settings),
+    ('/api/settings/personal', 'settings', 'personal', profile_api.get_personal_data),
+    ('/api/career-profiles/<profile_name>', 'profiles', 'profile:{profile_name}', profile_api.get_profile),
+    ('/api/career-profiles/active', 'profiles', 'active', profile_api.get_active_profile),
+]
+
+# (rule, method, resource, ProfileAPI method, body validator or None for no body)
+WRITE_ROUTES = [
+    ('/api/settings/global', 'PUT', 'settings', profile_api.update_global_settings, validate_global_settings),
+    ('/api/settings/personal', 'PUT', 'settings', profile_api.update_personal_data, validate_personal_data),
+    ('/api/career-profiles', 'POST', 'profiles', profile_api.create_profile, validate_create_profile),
+    ('/api/career-profiles/<profile_name>', 'PUT', 'profiles', profile_api.update_profile, validate_update_profile),
+    ('/api/career-profiles/<profile_name>', 'DELETE', 'profiles', profile_api.delete_profile, None),
+    ('/api/career-profiles/<profile_name>/activate', 'PUT', 'profiles', profile_api.set_active_profile, None),
+    ('/api/career-profiles/active', 'DELETE', 'profiles', profile_api.deactivate_profile, None),
+]
+
+for rule, resource, key, fn in READ_ROUTES:
+    app.add_url_rule(rule, endpoint=fn.__name__, view_func=_read_view(resource, key, fn), methods=['GET'])
+
+for rule, method, resource, fn, validator in WRITE_ROUTES:
+    view = _write_view(resource, fn, validator, idempotent=method == 'PUT')
+    app.add_url_rule(rule, endpoint=fn.__name__, view_func=view, methods=[method])
 
 @app.route('/api/career-profiles', methods=['GET'])
+@api_route
 def list_profiles():
-    """GET /api/profiles"""
-    try:
-        result = profile_api.list_profiles()
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in list_profiles: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/career-profiles/<profile_name>', methods=['GET'])
-def get_profile(profile_name):
-    """GET /api/profiles/{profile_name}"""
-    try:
-        result = profile_api.get_profile(profile_name)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in get_profile: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/career-profiles', methods=['POST'])
-def create_profile():
-    """POST /api/profiles"""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({
-                "success": False,
-                "message": "No data provided"
-            }), 400
-        
-        result = profile_api.create_profile(data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in create_profile: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/career-profiles/<profile_name>', methods=['PUT'])
-def update_profile(profile_name):
-    """PUT /api/profiles/{profile_name}"""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({
-                "success": False,
-                "message": "No data provided"
-            }), 400
-        
-        result = profile_api.update_profile(profile_name, data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in update_profile: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/career-profiles/<profile_name>', methods=['DELETE'])
-def delete_profile(profile_name):
-    """DELETE /api/profiles/{profile_name}"""
-    try:
-        result = profile_api.delete_profile(profile_name)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in delete_profile: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/career-profiles/<profile_name>/activate', methods=['PUT'])
-def set_active_profile(profile_name):
-    """PUT /api/profiles/{profile_name}/activate"""
-    try:
-        result = profile_api.set_active_profile(profile_name)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in set_active_profile: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/career-profiles/active', methods=['GET'])
-def get_active_profile():
-    """GET /api/profiles/active"""
-    try:
-        result = profile_api.get_active_profile()
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in get_active_profile: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/api/career-profiles/active', methods=['DELETE'])
-def deactivate_profile():
-    """DELETE /api/profiles/active"""
-    try:
-        result = profile_api.deactivate_profile()
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in deactivate_profile: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
+    """GET /api/profiles (?stream=1 streams one profile per line as NDJSON)"""
+    if request.args.get('stream', 'false').lower() in ('1', 'true'):
+        result = _list_profiles()
+        if not result.get("success", True):
+            return result
+        return Response(_ndjson(result.get("data") or []), mimetype="application/x-ndjson")
+    return _cached_response('profiles', 'list', _list_profiles)
+
+@app.route('/api/career-profiles/batch', methods=['POST'])
+@api_route
+def batch_profiles():
+    """POST /api/profiles/batch - body: [{"op": "create|update|delete", "name": ..., "data": {...}}]"""
+    operations = _json_body()
+    if not operations or not isinstance(operations, list):
+        return _no_data()
+
+    # Held for the whole batch so a concurrent profile PUT can't record a version
+    # that includes these writes (see _write_view)
+    with _write_locks['profiles']:
+        results = []
+        for operation in operations:
+            op = operation.get('op') if isinstance(operation, dict) else None
+            try:
+                if op == 'create':
+                    data = operation.get('data') or {}
+                    validate_create_profile(data)
+                    results.append(_create_profile(data))
+                elif op == 'update':
+                    data = operation.get('data') or {}
+                    validate_update_profile(data)
+                    results.append(_update_profile(operation.get('name'), data))
+                elif op == 'delete':
+                    results.append(_delete_profile(operation.get('name')))
+                else:
+                    results.append({"success": False, "message": f"Unknown operation: {op}"})
+            except JsonSchemaException as e:
+                results.append({"success": False, "message": f"Invalid data: {e.message}"})
+            except Exception:
+                logger.exception("Error in batch %s", op)
+                results.append({"success": False, "message": "Server error"})
+
+        # One invalidation for the whole batch instead of one per operation
+        _invalidate('profiles')
+
+    return {
+        "success": all(r.get("success", False) for r in results),
+        "results": results
+    }
+
+# The profile template is static, so it is encoded once at import time
+_template_result = _get_profile_template()
+if _template_result.get("success", True):
+    _TEMPLATE_BYTES = orjson.dumps(_template_result, option=ORJSON_OPTIONS)
+    _TEMPLATE_ETAG = hashlib.blake2b(_TEMPLATE_BYTES, digest_size=8).hexdigest()
+else:
+    _TEMPLATE_BYTES = _TEMPLATE_ETAG = None
 
 @app.route('/api/career-profiles/template', methods=['GET'])
 def get_profile_template():
     """GET /api/profiles/template"""
-    try:
-        result = profile_api.get_profile_template()
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in get_profile_template: {e}")
-        return jsonify({
-            "success": False,
-            "message": f"Server error: {str(e)}"
-        }), 500
-
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "Career Profile API",
-        "version": "1.0.0"
-    })
+    if _TEMPLATE_BYTES is None:
+        # Template could not be built at startup, keep retrying per request
+        return _cached_response('profiles', 'template', _get_profile_template)
+    response = app.response_class(_TEMPLATE_BYTES, mimetype="application/json")
+    response.set_etag(_TEMPLATE_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response.make_conditional(request)
+
+_HEALTH_BODY = b'{"status":"healthy","service":"Career Profile API","version":"1.0.0"}'
+
+# /health is polled constantly, so it is answered in front of Flask: no request context,
+# URL matching or after_request hooks. Only the exact path is handled here; the body is
+# below COMPRESS_MIN_SIZE, so Flask-Compress would not touch it anyway. flask_cors does
+# not see these requests, so the CORS headers (including preflight) are set here.
+_HEALTH_HEADERS = [
+    ('Content-Type', 'application/json'),
+    ('Content-Length', str(len(_HEALTH_BODY))),
+    ('Cache-Control', 'no-store'),
+    ('Access-Control-Allow-Origin', '*'),
+]
+_HEALTH_METHODS = 'GET, HEAD, OPTIONS'
+
+def _health_middleware(flask_app):
+    """WSGI wrapper answering /health itself and passing every other path to *flask_app*"""
+    def wsgi_app(environ, start_response):
+        if environ.get('PATH_INFO') != '/health':
+            return flask_app(environ, start_response)
+        method = environ['REQUEST_METHOD']
+        if method == 'OPTIONS':
+            headers = [
+                ('Access-Control-Allow-Origin', '*'),
+                ('Access-Control-Allow-Methods', _HEALTH_METHODS),
+                ('Content-Length', '0'),
+            ]
+            requested = environ.get('HTTP_ACCESS_CONTROL_REQUEST_HEADERS')
+            if requested:
+                headers.append(('Access-Control-Allow-Headers', requested))
+            start_response('200 OK', headers)
+            return [b'']
+        if method not in ('GET', 'HEAD'):
+            start_response('405 METHOD NOT ALLOWED', [('Allow', _HEALTH_METHODS), ('Content-Length', '0'),
+                                                      ('Access-Control-Allow-Origin', '*')])
+            return [b'']
+        start_response('200 OK', _HEALTH_HEADERS)
+        return [b''] if method == 'HEAD' else [_HEALTH_BODY]
+    return wsgi_app
+
+app.wsgi_app = _health_middleware(app.wsgi_app)
 
 if __name__ == '__main__':
     print("🚀 Starting Career Profile API Server...")
@@ -242,10 +497,14 @@ if __name__ == '__main__':
     print("  PUT  /api/profiles/{name}/activate")
     print("  GET  /api/profiles/active")
     print("  GET  /api/profiles/template")
+    print("  POST /api/profiles/batch")
     print("  GET  /health")
     print()
     print("💻 Server running on http://localhost:5003")
     print("🌐 CORS enabled for frontend integration")
     print("📁 Profile data stored in current directory")
+    print("⚙️  Dev server only - use: gunicorn -c gunicorn_conf.py career_profile_api_server:app")
     
+    # HTTP/1.1 lets the dev server keep connections alive between requests
+    WSGIRequestHandler.protocol_version = "HTTP/1.1"
     app.run(host='0.0.0.0', port=5003, debug=False)
\ No newline at end of file
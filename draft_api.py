@@ -14,23 +14,86 @@ Endpoints:
 
 from __future__ import annotations
 
+import asyncio
+import io
+import logging
 import os
+import queue
+import re
+import shutil
 import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import IO, List, Optional, Dict, Any, Union
+from urllib.parse import quote
+import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
 from draft_storage import (
     create_draft, get_draft, list_drafts, update_draft, delete_draft
 )
 
-# Global variables to store communication data
-job_selection_data = None
-application_approval_data = None
-
-app = FastAPI(title="Bewerbungshelfer Draft API", version="0.1.0")
+try:
+    from draft_storage import list_drafts_by_ids
+except ImportError:  # older draft_storage without the batched lookup
+    list_drafts_by_ids = None
+
+
+# Export logging goes through a queue so formatting and stderr writes happen on the
+# listener thread instead of the request threads
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler)
+logger.addHandler(QueueHandler(_log_queue))
+
+
+JOB_API_URL = os.environ.get("JOB_API_URL", "http://localhost:5002")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _log_listener.start()
+    # Hand-off slots between the frontend (POST) and the job hunter process (GET).
+    # Created here so they belong to the server's event loop. With several workers
+    # the slots must live in Redis, otherwise a POST and its GET can land on
+    # different processes.
+    redis_client = _redis_client()
+    if redis_client is not None:
+        app.state.job_selection_handoff = _RedisHandoff(redis_client, "draft_api:job_selection")
+        app.state.application_approval_handoff = _RedisHandoff(redis_client, "draft_api:application_approval")
+    else:
+        app.state.job_selection_handoff = _QueueHandoff()
+        app.state.application_approval_handoff = _QueueHandoff()
+    # Keep-alive connections to the job API for manual finalization
+    app.state.job_api = httpx.AsyncClient(
+        base_url=JOB_API_URL, timeout=30, limits=httpx.Limits(max_keepalive_connections=20)
+    )
+    yield
+    await app.state.job_api.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+    _log_listener.stop()
+
+
+app = FastAPI(title="Bewerbungshelfer Draft API", version="0.1.0", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 
 # Add CORS middleware to allow frontend access
 app.add_middleware(
@@ -54,12 +117,29 @@ class DraftUpdate(BaseModel):
     letter_text: Optional[str] = None
 
 
+class SenderAddress(BaseModel):
+    """The frontend sends null for personalData fields it has no value for."""
+    name: Optional[str] = None
+    street: Optional[str] = None
+    city: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+
+
+class CustomAddress(BaseModel):
+    """The parts of the frontend's editableData used for PDF export; other keys are ignored."""
+    personalData: Optional[SenderAddress] = None
+    companyAddress: Optional[str] = None
+    currentDate: Optional[str] = None
+
+
 class ExportRequest(BaseModel):
     ids: List[int]
     export_path: Optional[str] = None
     custom_filename: Optional[str] = None  # Custom filename for single exports
-    custom_addresses: Optional[Dict[int, Dict[str, Any]]] = None  # draft_id -> editableData
+    custom_addresses: Optional[Dict[int, CustomAddress]] = None  # draft_id -> editableData
     custom_letter_text: Optional[Dict[int, str]] = None  # draft_id -> edited letter text
+    stream: bool = False  # Single export without export_path: return the PDF bytes instead of writing files
 
 class JobSelectionRequest(BaseModel):
     type: str = Field(..., example="job_selection")
@@ -70,59 +150,88 @@ class ApplicationApprovalRequest(BaseModel):
     approved_applications: List[Dict[str, Any]] = Field(..., example=[{"job_id": 1, "application_text": "..."}])
 
 
-def generate_pdf_from_draft(draft_data: Dict[str, Any], output_path: str, custom_addresses: Optional[Dict[str, Any]] = None, custom_letter_text: Optional[str] = None) -> bool:
-    """Generate PDF from draft data using existing PDF generation logic."""
-    try:
+# Placeholder texts the frontend shows in place of a real company address
+PLACEHOLDER_PATTERNS = [
+    '[Adresse wird wie beim PDF-Export ermittelt]',
+    'Adresse wird wie beim PDF-Export ermittelt',
+    'Klicken zum Bearbeiten',
+    'wird automatisch ermittelt',
+    'Bei PDF-Export'
+]
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, PLACEHOLDER_PATTERNS)))
+
+# Anything but letters, digits, space, '-' and '_' (\w matches exactly isalnum() plus '_')
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w \-]")
+
+
+def _safe_filename_part(value: str) -> str:
+    return _FILENAME_UNSAFE_RE.sub("", value).strip()
+
+
+_turbo_local = threading.local()
+
+
+def _get_turbo():
+    """Return this thread's TurboBewerbungsHelfer, creating it on first use.
+
+    The helper is not known to be thread-safe, so each thread (and therefore each
+    export worker process) gets its own instance rather than one shared global.
+    """
+    turbo = getattr(_turbo_local, "turbo", None)
+    if turbo is None:
         # Import the existing PDF generation class
         from booster_turbo import TurboBewerbungsHelfer
-        
-        # Create instance of the PDF generator
-        turbo = TurboBewerbungsHelfer()
+        turbo = _turbo_local.turbo = TurboBewerbungsHelfer()
+    return turbo
+
+
+def generate_pdf_from_draft(draft_data: Dict[str, Any], output_path: Union[str, IO[bytes]], custom_addresses: Optional[CustomAddress] = None, custom_letter_text: Optional[str] = None) -> Optional[Union[str, IO[bytes]]]:
+    """Generate PDF from draft data using existing PDF generation logic.
+
+    output_path may be a file path or a binary file-like object. Returns
+    output_path once the PDF is written, or None if generation failed.
+    """
+    try:
+        # Reuse this thread's PDF generator instead of constructing one per PDF
+        turbo = _get_turbo()
         
         # Prepare user-provided addresses if available
         user_sender_address = None
         user_company_address = None
         
         if custom_addresses:
-            print(f"📄 PDF Export: Using custom addresses for draft {draft_data.get('id', 'unknown')}")
+            logger.debug("📄 PDF Export: Using custom addresses for draft %s", draft_data.get('id', 'unknown'))
             
             # Format personal data for PDF system
-            if custom_addresses.get('personalData'):
-                personal = custom_addresses['personalData']
-                user_sender_address = f"{personal.get('name', '')}\n{personal.get('street', '')}\n{personal.get('city', '')}\n{personal.get('phone', '')}\n{personal.get('email', '')}"
-                print(f"📍 Custom sender address: {user_sender_address[:50]}...")
+            personal = custom_addresses.personalData
+            if personal:
+                user_sender_address = "\n".join(
+                    value or "" for value in (personal.name, personal.street, personal.city, personal.phone, personal.email)
+                )
+                logger.debug("📍 Custom sender address: %.50s...", user_sender_address)
             
             # Format company address for PDF system  
-            if custom_addresses.get('companyAddress'):
-                company_addr = custom_addresses['companyAddress']
-                print(f"🔍 DEBUG: Received company address: '{company_addr}'")
+            company_addr = custom_addresses.companyAddress
+            if company_addr:
+                logger.debug("🔍 Received company address: %r", company_addr)
                 
                 # 🔧 FIX: Ignore placeholder text - trigger automatic resolution instead
-                # Enhanced detection for various placeholder patterns
-                placeholder_patterns = [
-                    '[Adresse wird wie beim PDF-Export ermittelt]',
-                    'Adresse wird wie beim PDF-Export ermittelt',
-                    'Klicken zum Bearbeiten',
-                    'wird automatisch ermittelt',
-                    'Bei PDF-Export'
-                ]
-                
-                is_placeholder = any(pattern in company_addr for pattern in placeholder_patterns)
+                is_placeholder = _PLACEHOLDER_RE.search(company_addr) is not None
                 
                 if is_placeholder:
-                    print(f"🔧 Detected placeholder text - using automatic address resolution")
+                    logger.debug("🔧 Detected placeholder text - using automatic address resolution")
                     user_company_address = None  # Trigger automatic resolution
                 else:
                     user_company_address = company_addr
-                    print(f"🏢 Custom company address: {user_company_address[:50]}...")
+                    logger.debug("🏢 Custom company address: %.50s...", user_company_address)
         else:
-            print(f"📄 PDF Export: Using automatic address detection for draft {draft_data.get('id', 'unknown')}")
+            logger.debug("📄 PDF Export: Using automatic address detection for draft %s", draft_data.get('id', 'unknown'))
         
         # Get custom date if provided
         user_custom_date = None
-        if custom_addresses and custom_addresses.get('currentDate'):
-            user_custom_date = custom_addresses['currentDate']
-            print(f"📅 Custom date: {user_custom_date}")
+        if custom_addresses and custom_addresses.currentDate:
+            user_custom_date = custom_addresses.currentDate
+            logger.debug("📅 Custom date: %s", user_custom_date)
         
         # Create job_data structure for PDF generation
         job_data = {
@@ -137,7 +246,7 @@ def generate_pdf_from_draft(draft_data: Dict[str, Any], output_path: str, custom
         
         # Use custom letter text if provided, otherwise use draft letter text
         letter_text_to_use = custom_letter_text if custom_letter_text else draft_data['letter_text']
-        print(f"📝 Using letter text: {'custom edited' if custom_letter_text else 'from database'}")
+        logger.debug("📝 Using letter text: %s", 'custom edited' if custom_letter_text else 'from database')
         
         # Generate PDF using existing function
         success = turbo.create_professional_pdf(
@@ -147,62 +256,169 @@ def generate_pdf_from_draft(draft_data: Dict[str, Any], output_path: str, custom
             job_data=job_data
         )
         
-        return success
+        return output_path if success else None
         
     except Exception as e:
-        print(f"PDF generation error: {e}")
-        return False
+        logger.error("PDF generation error: %s", e)
+        return None
+
+
+# Worker processes for multi-draft exports; PDF rendering is CPU-bound and holds the GIL
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+# Exports run via asyncio.to_thread, so two of them may try to start the pool at once
+_pdf_pool_lock = threading.Lock()
+
+
+def _init_pdf_worker() -> None:
+    # The log listener only runs in the server process, so workers log directly
+    logger.handlers[:] = [_log_handler]
+
+
+def _render_pdfs(tasks: List[tuple]) -> List[Optional[str]]:
+    """Render (draft, output_path, custom_addresses, custom_letter_text) tasks, preserving order."""
+    global _pdf_pool
+    if len(tasks) >= 2:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_pdf_worker)
+            pool = _pdf_pool
+        try:
+            return list(pool.map(generate_pdf_from_draft, *zip(*tasks), chunksize=1))
+        except BrokenProcessPool as e:
+            # Failed initializer or dead worker: drop the pool so the next export starts a fresh one
+            logger.error("PDF worker pool broken, rendering in-process: %s", e)
+            with _pdf_pool_lock:
+                if _pdf_pool is pool:
+                    _pdf_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+    # Single PDFs skip process start-up and pickling; also the fallback for a broken pool
+    return [generate_pdf_from_draft(*task) for task in tasks]
 
 
 @app.get("/drafts")
-def api_list_drafts(limit: int = 1000, offset: int = 0):
+async def api_list_drafts(limit: int = 1000, offset: int = 0):
     """List drafts with higher default limit and newest-first sorting"""
-    return list_drafts(limit=limit, offset=offset)
+    return await asyncio.to_thread(list_drafts, limit=limit, offset=offset)
 
 
 @app.get("/drafts/{draft_id}")
-def api_get_draft(draft_id: int):
-    draft = get_draft(draft_id)
+async def api_get_draft(draft_id: int):
+    draft = await asyncio.to_thread(get_draft, draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
     return draft
 
 
 @app.post("/drafts", status_code=201)
-def api_create_draft(payload: DraftIn):
-    return create_draft({"company": payload.company, "title": payload.title}, payload.letter_text)
+async def api_create_draft(payload: DraftIn):
+    draft = await asyncio.to_thread(create_draft, {"company": payload.company, "title": payload.title}, payload.letter_text)
+    _invalidate_drafts()
+    return draft
 
 
 @app.put("/drafts/{draft_id}")
-def api_update_draft(draft_id: int, payload: DraftUpdate):
-    ok = update_draft(draft_id,
-                      company=payload.company,
-                      job_title=payload.title,  # payload.title maps to job_title in storage
-                      letter_text=payload.letter_text)
+async def api_update_draft(draft_id: int, payload: DraftUpdate):
+    ok = await asyncio.to_thread(update_draft, draft_id,
+                                 company=payload.company,
+                                 job_title=payload.title,  # payload.title maps to job_title in storage
+                                 letter_text=payload.letter_text)
+    _invalidate_drafts()
     if not ok:
         raise HTTPException(status_code=404, detail="Draft not found or no fields updated")
     return {"success": True}
 
 
 @app.delete("/drafts/{draft_id}")
-def api_delete_draft(draft_id: int):
-    ok = delete_draft(draft_id)
+async def api_delete_draft(draft_id: int):
+    ok = await asyncio.to_thread(delete_draft, draft_id)
+    _invalidate_drafts()
     if not ok:
         raise HTTPException(status_code=404, detail="Draft not found")
     return {"success": True}
 
 
 @app.post("/drafts/export")
-def api_export_drafts(req: ExportRequest):
+async def api_export_drafts(req: ExportRequest):
     """Export selected drafts to PDF files."""
+    # PDF rendering and file copies block, so keep them off the event loop
+    if req.stream and len(req.ids) == 1 and not req.export_path:
+        return await asyncio.to_thread(_single_draft_pdf, req)
+    return await asyncio.to_thread(_export_drafts, req)
+
+
+def _export_filename(req: ExportRequest, draft: Dict[str, Any], timestamp: str) -> str:
+    # Use custom filename if provided and single export
+    if req.custom_filename and len(req.ids) == 1:
+        # Use custom filename, ensure .pdf extension
+        filename = req.custom_filename if req.custom_filename.endswith('.pdf') else f"{req.custom_filename}.pdf"
+        logger.debug("📝 Using custom filename: %s", filename)
+    else:
+        # Generate automatic filename
+        safe_company = _safe_filename_part(draft['company'])
+        safe_title = _safe_filename_part(draft['job_title'])
+        filename = f"Bewerbung_{safe_company}_{safe_title}_{timestamp}.pdf"
+        logger.debug("📝 Using auto-generated filename: %s", filename)
+    return filename
+
+
+def _single_draft_pdf(req: ExportRequest) -> Response:
+    """Render one draft in memory and return it as a PDF download (no files, no Applications copy)."""
+    draft_id = req.ids[0]
+    draft = get_draft(draft_id)
+    if not draft:
+        raise HTTPException(status_code=404, detail=f"Draft {draft_id} not found")
+    
+    filename = _export_filename(req, draft, datetime.now().strftime("%Y%m%d_%H%M%S"))
+    custom_addresses = {int(k): v for k, v in (req.custom_addresses or {}).items()}.get(draft_id)
+    custom_letter_text = {int(k): v for k, v in (req.custom_letter_text or {}).items()}.get(draft_id)
+    
+    buf = io.BytesIO()
+    if generate_pdf_from_draft(draft, buf, custom_addresses, custom_letter_text) is None:
+        raise HTTPException(status_code=500, detail=f"Failed to generate PDF for draft {draft_id}")
+    # The PDF is already in memory: send it in one body with a Content-Length
+    return Response(
+        buf.getvalue(),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"},
+    )
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link *dst* to *src*, falling back to a copy (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        # A re-export over an earlier link already updated dst in place
+        if not os.path.samefile(src, dst):
+            shutil.copy2(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _get_drafts_by_ids(ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """Fetch the given drafts in one query when draft_storage supports it."""
+    unique_ids = list(dict.fromkeys(ids))
+    if list_drafts_by_ids is not None:
+        return {d['id']: d for d in list_drafts_by_ids(unique_ids)}
+    drafts = {}
+    for draft_id in unique_ids:
+        draft = get_draft(draft_id)
+        if draft:
+            drafts[draft_id] = draft
+    return drafts
+
+
+def _export_drafts(req: ExportRequest) -> Dict[str, Any]:
     if not req.ids:
         return {"status": "error", "message": "No draft IDs provided"}
     
     exported_files = []
     errors = []
     
-    # Create export directory with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Create export directory with timestamp; date_str names the Applications copies
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    date_str = now.strftime("%Y-%m-%d")
     
     # Use custom export path if provided, otherwise use default
     if req.export_path:
@@ -216,63 +432,59 @@ def api_export_drafts(req: ExportRequest):
         export_dir = f"applications/Draft_Export_{timestamp}"
         os.makedirs(export_dir, exist_ok=True)
     
+    # Key the overrides by int once; the frontend may send draft ids as strings
+    custom_addresses_by_id = {int(k): v for k, v in (req.custom_addresses or {}).items()}
+    custom_letter_text_by_id = {int(k): v for k, v in (req.custom_letter_text or {}).items()}
+    
+    # 1) Prepare one render task per draft
+    try:
+        drafts_by_id = _get_drafts_by_ids(req.ids)
+    except Exception as e:
+        return {"status": "error", "message": f"Could not load drafts: {str(e)}"}
+    tasks = []
+    used_paths = set()
     for draft_id in req.ids:
         try:
-            # Get draft data
-            draft = get_draft(draft_id)
+            draft = drafts_by_id.get(draft_id)
             if not draft:
                 errors.append(f"Draft {draft_id} not found")
                 continue
             
-            # Generate filename - use custom filename if provided and single export
-            if req.custom_filename and len(req.ids) == 1:
-                # Use custom filename, ensure .pdf extension
-                filename = req.custom_filename if req.custom_filename.endswith('.pdf') else f"{req.custom_filename}.pdf"
-                print(f"📝 Using custom filename: {filename}")
-            else:
-                # Generate automatic filename
-                safe_company = "".join(c for c in draft['company'] if c.isalnum() or c in (' ', '-', '_')).strip()
-                safe_title = "".join(c for c in draft['job_title'] if c.isalnum() or c in (' ', '-', '_')).strip()
-                filename = f"Bewerbung_{safe_company}_{safe_title}_{timestamp}.pdf"
-                print(f"📝 Using auto-generated filename: {filename}")
+            filename = _export_filename(req, draft, timestamp)
             
             output_path = os.path.join(export_dir, filename)
+            if output_path in used_paths:
+                # Same company + title twice in one batch: parallel renders must not share a file
+                filename = f"{filename[:-4]}_{draft_id}.pdf"
+                output_path = os.path.join(export_dir, filename)
+            used_paths.add(output_path)
             
-            # Get custom addresses for this draft if provided
-            custom_addresses = None
-            if req.custom_addresses:
-                # Try both integer and string keys (frontend might send strings)
-                if draft_id in req.custom_addresses:
-                    custom_addresses = req.custom_addresses[draft_id]
-                    print(f"🎯 Using custom addresses for draft {draft_id} (int key): {custom_addresses}")
-                elif str(draft_id) in req.custom_addresses:
-                    custom_addresses = req.custom_addresses[str(draft_id)]
-                    print(f"🎯 Using custom addresses for draft {draft_id} (str key): {custom_addresses}")
-                else:
-                    print(f"❌ No custom addresses found for draft {draft_id}")
-                    print(f"   Available custom_addresses keys: {list(req.custom_addresses.keys())}")
-            else:
-                print(f"❌ No custom_addresses in request at all")
-            
-            # Get custom letter text for this draft if provided
-            custom_letter_text = None
-            if req.custom_letter_text:
-                # Try both integer and string keys (frontend might send strings)
-                if draft_id in req.custom_letter_text:
-                    custom_letter_text = req.custom_letter_text[draft_id]
-                    print(f"📝 Using custom letter text for draft {draft_id} (int key): {custom_letter_text[:100]}...")
-                elif str(draft_id) in req.custom_letter_text:
-                    custom_letter_text = req.custom_letter_text[str(draft_id)]
-                    print(f"📝 Using custom letter text for draft {draft_id} (str key): {custom_letter_text[:100]}...")
-                else:
-                    print(f"❌ No custom letter text found for draft {draft_id}")
-            else:
-                print(f"❌ No custom_letter_text in request at all")
+            # Per-draft overrides from the frontend editor, if any
+            custom_addresses = custom_addresses_by_id.get(draft_id)
+            custom_letter_text = custom_letter_text_by_id.get(draft_id)
+            logger.debug("🎯 Draft %s: custom addresses %s, custom letter text %s", draft_id,
+                         "yes" if custom_addresses else "no", "yes" if custom_letter_text else "no")
             
-            # Generate PDF
-            success = generate_pdf_from_draft(draft, output_path, custom_addresses, custom_letter_text)
-            
-            if success and os.path.exists(output_path):
+            tasks.append((draft_id, draft, filename, output_path, custom_addresses, custom_letter_text))
+                
+        except Exception as e:
+            errors.append(f"Error processing draft {draft_id}: {str(e)}")
+    
+    # 2) Render all PDFs, in parallel worker processes for multi-draft exports
+    try:
+        results = _render_pdfs([(draft, output_path, custom_addresses, custom_letter_text)
+                                for _, draft, _, output_path, custom_addresses, custom_letter_text in tasks])
+    except Exception as e:
+        logger.error("PDF generation error: %s", e)
+        results = [None] * len(tasks)
+    
+    # 3) Collect results and create the Applications folder copies
+    # Check once whether the user already exported to the applications folder
+    is_already_in_applications = 'applications' in os.path.normpath(export_dir).lower()
+    for (draft_id, draft, filename, output_path, custom_addresses, custom_letter_text), pdf_path in zip(tasks, results):
+        try:
+            # generate_pdf_from_draft only returns a path once the PDF is written
+            if pdf_path:
                 exported_files.append({
                     "draft_id": draft_id,
                     "filename": filename,
@@ -281,22 +493,16 @@ def api_export_drafts(req: ExportRequest):
                 
                 # 🔧 FIX: Only create Applications copy if user didn't already choose Applications folder
                 try:
-                    # Check if user already exported to applications folder
-                    export_dir_norm = os.path.normpath(export_dir).lower()
-                    is_already_in_applications = 'applications' in export_dir_norm
-                    
                     if not is_already_in_applications:
-                        print(f"📂 Creating additional copy in Applications folder (user chose: {export_dir})")
+                        logger.debug("📂 Creating additional copy in Applications folder (user chose: %s)", export_dir)
                         # Create company-specific applications folder
-                        company_clean = "".join(c for c in draft['company'] if c.isalnum() or c in (' ', '-', '_')).strip()[:40] or "Company"
-                        date_str = datetime.now().strftime("%Y-%m-%d")
+                        company_clean = _safe_filename_part(draft['company'])[:40] or "Company"
                         apps_dir = f"applications/{company_clean}_{date_str}"
                         os.makedirs(apps_dir, exist_ok=True)
                         
                         # Copy PDF to applications folder
                         apps_pdf_path = os.path.join(apps_dir, filename)
-                        import shutil
-                        shutil.copy2(output_path, apps_pdf_path)
+                        _link_or_copy(output_path, apps_pdf_path)
                         
                         # Also create TXT version in applications folder (for consistency)
                         txt_filename = filename.replace('.pdf', '.txt')
@@ -305,12 +511,12 @@ def api_export_drafts(req: ExportRequest):
                             letter_text = custom_letter_text if custom_letter_text else draft['letter_text']
                             f.write(letter_text)
                         
-                        print(f"📂 Additional copy created in applications folder: {apps_dir}")
+                        logger.debug("📂 Additional copy created in applications folder: %s", apps_dir)
                     else:
-                        print(f"✅ User already chose Applications folder - skipping duplicate copy")
+                        logger.debug("✅ User already chose Applications folder - skipping duplicate copy")
                     
                 except Exception as e:
-                    print(f"⚠️  Warning: Could not create applications folder copy: {e}")
+                    logger.warning("⚠️  Could not create applications folder copy: %s", e)
                     # Don't fail the export if applications folder creation fails
                     
             else:
@@ -333,16 +539,75 @@ def api_export_drafts(req: ExportRequest):
     return result
 
 
+# Longest a GET /job-selection or /application-approval may hold the connection open
+MAX_HANDOFF_WAIT_SECONDS = 60.0
+
+
+class _QueueHandoff:
+    """Single-slot hand-off inside this process (latest unconsumed entry wins)."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    async def offer(self, data: Dict[str, Any]) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(data)
+
+    async def take(self, wait: float) -> Optional[Dict[str, Any]]:
+        """Take the pending entry, waiting up to *wait* seconds for one to arrive."""
+        if wait <= 0:
+            try:
+                return self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=min(wait, MAX_HANDOFF_WAIT_SECONDS))
+        except asyncio.TimeoutError:
+            return None
+
+
+class _RedisHandoff:
+    """Same single-slot semantics on a Redis list, shared by all API workers."""
+
+    def __init__(self, client, key: str):
+        self._client = client
+        self._key = key
+
+    async def offer(self, data: Dict[str, Any]) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            await pipe.delete(self._key).rpush(self._key, orjson.dumps(data)).execute()
+
+    async def take(self, wait: float) -> Optional[Dict[str, Any]]:
+        if wait <= 0:
+            raw = await self._client.lpop(self._key)
+        else:
+            popped = await self._client.blpop([self._key], timeout=min(wait, MAX_HANDOFF_WAIT_SECONDS))
+            raw = popped[1] if popped else None
+        return orjson.loads(raw) if raw is not None else None
+
+
+def _redis_client():
+    """Redis client for DRAFT_API_REDIS_URL, or None to keep the hand-off in process."""
+    url = os.environ.get("DRAFT_API_REDIS_URL")
+    if not url:
+        return None
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        logger.warning("DRAFT_API_REDIS_URL is set but redis is not installed; using in-process hand-off")
+        return None
+    return aioredis.from_url(url)
+
+
 @app.post("/job-selection")
-def api_job_selection(req: JobSelectionRequest):
+async def api_job_selection(req: JobSelectionRequest):
     """Receive job selection from frontend and store it for the Python process."""
-    global job_selection_data
-    
-    job_selection_data = {
+    await app.state.job_selection_handoff.offer({
         "type": req.type,
         "selected_job_ids": req.selected_job_ids,
         "timestamp": datetime.now().isoformat()
-    }
+    })
     
     print(f"📡 Received job selection via HTTP: {req.selected_job_ids}")
     
@@ -350,29 +615,27 @@ def api_job_selection(req: JobSelectionRequest):
 
 
 @app.get("/job-selection")
-def api_get_job_selection():
-    """Get stored job selection data for the Python process."""
-    global job_selection_data
-    
-    if job_selection_data:
-        # Return and clear the data (one-time use)
-        data = job_selection_data
-        job_selection_data = None
-        return data
-    else:
+async def api_get_job_selection(wait: float = 0):
+    """Get stored job selection data for the Python process.
+
+    With ``?wait=N`` the request long-polls: it returns as soon as a selection
+    arrives, or 404s after N seconds.
+    """
+    # Return and clear the data (one-time use)
+    data = await app.state.job_selection_handoff.take(wait)
+    if data is None:
         raise HTTPException(status_code=404, detail="No job selection data available")
+    return data
 
 
 @app.post("/application-approval")
-def api_application_approval(req: ApplicationApprovalRequest):
+async def api_application_approval(req: ApplicationApprovalRequest):
     """Receive application approval from frontend and store it for the Python process."""
-    global application_approval_data
-    
-    application_approval_data = {
+    await app.state.application_approval_handoff.offer({
         "type": req.type,
         "approved_applications": req.approved_applications,
         "timestamp": datetime.now().isoformat()
-    }
+    })
     
     print(f"📡 Received application approval via HTTP: {len(req.approved_applications)} applications")
     
@@ -380,34 +643,94 @@ def api_application_approval(req: ApplicationApprovalRequest):
 
 
 @app.get("/application-approval")
-def api_get_application_approval():
-    """Get stored application approval data for the Python process."""
-    global application_approval_data
-    
-    if application_approval_data:
-        # Return and clear the data (one-time use)
-        data = application_approval_data
-        application_approval_data = None
-        return data
-    else:
+async def api_get_application_approval(wait: float = 0):
+    """Get stored application approval data for the Python process (``?wait=N`` long-polls)."""
+    # Return and clear the data (one-time use)
+    data = await app.state.application_approval_handoff.take(wait)
+    if data is None:
         raise HTTPException(status_code=404, detail="No application approval data available")
+    return data
 
 
 @app.post("/debug-log")
-def api_debug_log(data: dict):
+async def api_debug_log(data: dict):
     """Debug endpoint to log frontend data."""
-    import json
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"\n=== DEBUG LOG {timestamp} ===")
     print(f"Message: {data.get('message', 'No message')}")
-    print(f"Data: {json.dumps(data.get('data', {}), indent=2)}")
+    print(f"Data: {orjson.dumps(data.get('data', {}), option=orjson.OPT_INDENT_2).decode()}")
     print(f"Draft ID: {data.get('draftId', 'No ID')}")
     print("=" * 50)
     return {"status": "logged"}
 
 
+def _build_draft_index(drafts: List[Dict[str, Any]]) -> Dict[str, List[tuple]]:
+    """Group drafts by lower-cased company as (position, lower-cased title, draft) entries."""
+    index: Dict[str, List[tuple]] = {}
+    for position, draft in enumerate(drafts):
+        draft_company = (draft.get('company') or '').strip().lower()
+        draft_title = (draft.get('job_title') or '').strip().lower()
+        index.setdefault(draft_company, []).append((position, draft_title, draft))
+    return index
+
+
+@lru_cache(maxsize=4096)
+def _title_words(title: str) -> tuple:
+    # The frontend polls with the same job titles, so the split is cached
+    return tuple(word.lower() for word in title.split() if len(word) > 3)
+
+
+def _find_matching_draft(draft_index: Dict[str, List[tuple]], company: str, title: str) -> Optional[Dict[str, Any]]:
+    """Return the first draft (in list order) matching *company* and *title*.
+
+    Simple fuzzy matching (case-insensitive, partial match): the companies must
+    contain one another and some title word longer than 3 characters must
+    appear in the draft title.
+    """
+    title_words = _title_words(title)
+    if not title_words:
+        return None
+    company = company.lower()
+    best = None
+    for draft_company, entries in draft_index.items():
+        if company not in draft_company and draft_company not in company:
+            continue
+        for position, draft_title, draft in entries:
+            if best is not None and position > best[0]:
+                break
+            if any(word in draft_title for word in title_words):
+                best = (position, draft)
+                break
+    return best[1] if best else None
+
+
+# Frontend polls the status endpoint, so the draft index is reused for a few seconds.
+# Writes through this API bump the version; drafts written by other processes show
+# up once the TTL expires.
+_DRAFT_INDEX_TTL_SECONDS = 5.0
+_drafts_version = 0
+_draft_index_cache: Optional[tuple] = None  # (version, expires_at, draft_index)
+
+
+def _invalidate_drafts() -> None:
+    global _drafts_version
+    _drafts_version += 1
+
+
+def _get_status_draft_index() -> Dict[str, List[tuple]]:
+    global _draft_index_cache
+    now = time.monotonic()
+    cached = _draft_index_cache
+    if cached and cached[0] == _drafts_version and cached[1] > now:
+        return cached[2]
+    version = _drafts_version
+    draft_index = _build_draft_index(list_drafts(limit=1000))  # Get up to 1000 drafts for matching
+    _draft_index_cache = (version, now + _DRAFT_INDEX_TTL_SECONDS, draft_index)
+    return draft_index
+
+
 @app.post("/drafts/application-status")
-def api_get_application_status(data: dict):
+async def api_get_application_status(data: dict):
     """Check application status for multiple jobs by company + job title matching"""
     try:
         jobs = data.get('jobs', [])
@@ -415,8 +738,8 @@ def api_get_application_status(data: dict):
         if not jobs:
             return {"success": False, "error": "jobs array is required"}
         
-        # Get all existing drafts
-        drafts = list_drafts(limit=1000)  # Get up to 1000 drafts for matching
+        # Get all existing drafts, normalized and grouped once (short-lived cache)
+        draft_index = await asyncio.to_thread(_get_status_draft_index)
         
         # Create mapping of job_id -> application status
         application_status = {}
@@ -427,23 +750,10 @@ def api_get_application_status(data: dict):
             title = job.get('title', '').strip()
             
             # Look for matching applications by company + job title (fuzzy matching)
-            has_application = False
-            application_date = None
-            draft_id = None
-            
-            for draft in drafts:
-                draft_company = draft.get('company', '').strip()
-                draft_title = draft.get('job_title', '').strip()
-                
-                # Simple fuzzy matching (case-insensitive, partial match)
-                company_match = company.lower() in draft_company.lower() or draft_company.lower() in company.lower()
-                title_match = any(word.lower() in draft_title.lower() for word in title.split() if len(word) > 3)
-                
-                if company_match and title_match:
-                    has_application = True
-                    application_date = draft.get('created_at')
-                    draft_id = draft.get('id')
-                    break
+            draft = _find_matching_draft(draft_index, company, title)
+            has_application = draft is not None
+            application_date = draft.get('created_at') if draft else None
+            draft_id = draft.get('id') if draft else None
             
             application_status[job_id] = {
                 'has_application': has_application,
@@ -465,8 +775,12 @@ def api_get_application_status(data: dict):
         return {"success": False, "error": str(e)}
 
 
+# Approvals finalized at once: each one makes the job API render a PDF and writes a draft
+_FINALIZE_CONCURRENCY = 4
+
+
 @app.post("/manual-job-finalization")
-def api_manual_job_finalization(data: dict):
+async def api_manual_job_finalization(data: dict):
     """Handle manual job finalization - create PDF from approved applications"""
     try:
         approved_applications = data.get('approved_applications', [])
@@ -474,84 +788,16 @@ def api_manual_job_finalization(data: dict):
         if not approved_applications:
             return {"success": False, "error": "No approved applications provided"}
         
-        # Simplified approach: Call the job API to trigger PDF creation
-        import requests
-        from pathlib import Path
-        import json
-        
-        processed_applications = []
-        
-        for app_data in approved_applications:
-            job_id = app_data.get('job_id')
-            application_text = app_data.get('application_text', '')
-            company_address = app_data.get('company_address', '')
-            
-            if not job_id or not application_text:
-                continue
-            
-            # Look for existing application data in temp storage
-            temp_file = Path(f"/tmp/manual_job_{job_id}.json")
-            if temp_file.exists():
-                with open(temp_file, 'r', encoding='utf-8') as f:
-                    job_data = json.load(f)
-                
-                # Update job data with user-provided address
-                if company_address and company_address.strip():
-                    job_data['user_company_address'] = company_address.strip()
-                
-                # Update application text if modified
-                if application_text != job_data.get('application_text', ''):
-                    job_data['application_text'] = application_text
-                
-                # Create PDF by calling job API finalize endpoint
-                try:
-                    finalize_response = requests.post('http://localhost:5002/api/finalize-manual-job', 
-                        json={
-                            'job_id': job_id,
-                            'application_text': application_text,
-                            'company_address': company_address
-                        }, 
-                        timeout=30
-                    )
-                    
-                    if finalize_response.status_code == 200:
-                        result = finalize_response.json()
-                        if result.get('success'):
-                            # Create draft for future editing
-                            job_info = {
-                                'company': job_data.get('company', 'Unknown Company'),
-                                'title': job_data.get('job_title', 'Unknown Position')
-                            }
-                            create_draft(job_info, application_text)
-                            
-                            # Update the temp file with save info
-                            job_data.update(result.get('save_info', {}))
-                            with open(temp_file, 'w', encoding='utf-8') as f:
-                                json.dump(job_data, f, ensure_ascii=False, indent=2)
-                            
-                            processed_applications.append({
-                                'job_id': job_id,
-                                'company': job_data.get('company'),
-                                'job_title': job_data.get('job_title'),
-                                'pdf_path': result.get('save_info', {}).get('pdf_path'),
-                                'txt_path': result.get('save_info', {}).get('txt_path'),
-                                'address_available': result.get('save_info', {}).get('address_available', False)
-                            })
-                            
-                            print(f"✅ Manual job finalized: {job_data.get('company')} - {job_data.get('job_title')}")
-                            if result.get('save_info', {}).get('pdf_path'):
-                                print(f"   📄 PDF created: {result['save_info']['pdf_path']}")
-                        else:
-                            print(f"❌ Job API finalization failed: {result.get('error', 'Unknown error')}")
-                    else:
-                        print(f"❌ Job API finalization request failed: {finalize_response.status_code}")
-                        
-                except requests.exceptions.RequestException as e:
-                    print(f"❌ Error communicating with job API: {e}")
-                    continue
-                except Exception as e:
-                    print(f"❌ Error processing manual job {job_id}: {e}")
-                    continue
+        # Simplified approach: Call the job API to trigger PDF creation, up to
+        # _FINALIZE_CONCURRENCY approvals at a time over the pooled client
+        limit = asyncio.Semaphore(_FINALIZE_CONCURRENCY)
+
+        async def finalize(app_data):
+            async with limit:
+                return await _finalize_manual_job(app.state.job_api, app_data)
+
+        results = await asyncio.gather(*(finalize(app_data) for app_data in approved_applications))
+        processed_applications = [result for result in results if result is not None]
         
         return {
             "success": True,
@@ -564,6 +810,80 @@ def api_manual_job_finalization(data: dict):
         return {"success": False, "error": str(e)}
 
 
+async def _finalize_manual_job(client: httpx.AsyncClient, app_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Finalize one approved application; returns its summary, or None if it was skipped or failed."""
+    job_id = app_data.get('job_id')
+    application_text = app_data.get('application_text', '')
+    company_address = app_data.get('company_address', '')
+    
+    if not job_id or not application_text:
+        return None
+    
+    # Look for existing application data in temp storage
+    temp_file = Path(f"/tmp/manual_job_{job_id}.json")
+    if not temp_file.exists():
+        return None
+    job_data = orjson.loads(await asyncio.to_thread(temp_file.read_bytes))
+    
+    # Update job data with user-provided address
+    if company_address and company_address.strip():
+        job_data['user_company_address'] = company_address.strip()
+    
+    # Update application text if modified
+    if application_text != job_data.get('application_text', ''):
+        job_data['application_text'] = application_text
+    
+    # Create PDF by calling job API finalize endpoint
+    try:
+        finalize_response = await client.post('/api/finalize-manual-job', json={
+            'job_id': job_id,
+            'application_text': application_text,
+            'company_address': company_address
+        })
+        
+        if finalize_response.status_code != 200:
+            print(f"❌ Job API finalization request failed: {finalize_response.status_code}")
+            return None
+        
+        result = finalize_response.json()
+        if not result.get('success'):
+            print(f"❌ Job API finalization failed: {result.get('error', 'Unknown error')}")
+            return None
+        
+        # Create draft for future editing
+        job_info = {
+            'company': job_data.get('company', 'Unknown Company'),
+            'title': job_data.get('job_title', 'Unknown Position')
+        }
+        await asyncio.to_thread(create_draft, job_info, application_text)
+        _invalidate_drafts()
+        
+        # Update the temp file with save info
+        save_info = result.get('save_info', {})
+        job_data.update(save_info)
+        await asyncio.to_thread(temp_file.write_bytes, orjson.dumps(job_data, option=orjson.OPT_INDENT_2))
+        
+        print(f"✅ Manual job finalized: {job_data.get('company')} - {job_data.get('job_title')}")
+        if save_info.get('pdf_path'):
+            print(f"   📄 PDF created: {save_info['pdf_path']}")
+        
+        return {
+            'job_id': job_id,
+            'company': job_data.get('company'),
+            'job_title': job_data.get('job_title'),
+            'pdf_path': save_info.get('pdf_path'),
+            'txt_path': save_info.get('txt_path'),
+            'address_available': save_info.get('address_available', False)
+        }
+        
+    except httpx.HTTPError as e:
+        print(f"❌ Error communicating with job API: {e}")
+        return None
+    except Exception as e:
+        print(f"❌ Error processing manual job {job_id}: {e}")
+        return None
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=8000)
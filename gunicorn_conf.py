@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for the Career Profile API
+
+Usage:
+    gunicorn -c gunicorn_conf.py career_profile_api_server:app
+"""
+
+import os
+
+bind = os.environ.get("CAREER_PROFILE_API_BIND", "0.0.0.0:5003")
+
+# Threaded workers: ProfileDataManager does blocking file I/O, which releases the
+# GIL but would stall a gevent hub, so real threads overlap it better. gevent
+# stays selectable via GUNICORN_WORKER_CLASS for connection-heavy setups.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", "64"))
+worker_connections = 1000
+
+# The response cache and its version counters live in the worker process, so a
+# write handled by one worker cannot invalidate another worker's cache. Keep a
+# single worker unless the cache is disabled or moved out of process.
+workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+
+# Import the app once in the master: profile_api and the precomputed template
+# response are built before forking and shared copy-on-write with the workers
+preload_app = True
+
+timeout = 30
+keepalive = 5
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info").lower()
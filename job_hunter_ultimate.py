@@ -7,18 +7,40 @@
 import os
 import sys
 import json
+import logging
 import time
+import orjson
 import random
 import argparse
+import atexit
+import contextlib
+import csv
+import queue
 import re
 import requests
+import shutil
+import traceback
+import uuid
 import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from urllib.parse import quote_plus, urlparse
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import urllib3
 import warnings
+import yaml
+from bs4 import BeautifulSoup
+import soupsieve
+from functools import lru_cache
+
+try:
+    import ahocorasick  # optional: single-pass skill keyword matching
+except ImportError:  # pragma: no cover - falls back to per-keyword substring checks
+    ahocorasick = None
 
 # Lokale Imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -35,15 +57,43 @@ from job_ranker import JobRanker
 from job_utils import (
     normalize_text, build_query_variations, safe_api_call, validate_job_data,
     clean_filename_string, clean_company_name_string, clean_job_title_string,
-    normalize_job_url
+    normalize_job_url, remove_gendering
 )
 
+# Pure str -> str cleaners; a batch repeats the same company and title strings
+clean_filename_string = lru_cache(maxsize=1024)(clean_filename_string)
+clean_company_name_string = lru_cache(maxsize=1024)(clean_company_name_string)
+clean_job_title_string = lru_cache(maxsize=1024)(clean_job_title_string)
+
 # Import new profile-specific cache system
 from profile_job_cache import ProfileJobCache
 
 # Centralized configuration
 from config_manager import ConfigManager
 
+try:
+    from draft_storage import batch as draft_batch  # one transaction for several create_draft calls
+except ImportError:  # older draft_storage without batched commits
+    draft_batch = contextlib.nullcontext
+
+# Analytics DB is optional - completions are still recorded without it
+try:
+    from analytics_manager import AnalyticsManager, ApplicationAnalytics
+except ImportError as _analytics_import_error:
+    AnalyticsManager = ApplicationAnalytics = None
+    _ANALYTICS_IMPORT_ERROR = str(_analytics_import_error)
+else:
+    _ANALYTICS_IMPORT_ERROR = None
+
+# Address parsing / post-processing diagnostics are DEBUG records on stderr (stdout carries
+# the GUI's JSON events); LOG_LEVEL=DEBUG turns them on. %-style args are only formatted then.
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(levelname)s %(name)s: %(message)s'))
+logger.addHandler(_log_handler)
+
 # ---------------------------------------------------------------------------
 # Suppress noisy SSL warnings coming from urllib3 LibreSSL builds (Task 32.18)
 # ---------------------------------------------------------------------------
@@ -85,6 +135,489 @@ warnings.filterwarnings(
 # 🛡️ Note: Utility functions moved to job_utils.py
 # =========================================
 
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # libyaml when available
+
+
+@lru_cache(maxsize=8)
+def _load_preferences(path, mtime_ns):
+    """Parse a preferences YAML file; cached per (path, mtime_ns) so edits are picked up"""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+class _MinIntervalLimiter:
+    """Spaces out calls per key (e.g. per job API) by at least *interval* seconds"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def call(self, key, fn, *args, **kwargs):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+        return fn(*args, **kwargs)
+
+
+# Keeps the old 2s spacing between queries per API while different APIs run concurrently
+_API_RATE_LIMITER = _MinIntervalLimiter(2.0)
+
+
+class _ScrapeCache:
+    """URL -> scraped content with a TTL, persisted as an append-only JSONL file
+
+    Thread-safe, so the parallel prefetch in process_top_jobs can share it. Expired
+    entries are dropped (and the file compacted) when the cache is loaded.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._load()
+
+    def _load(self):
+        # Runs in the hunter's __init__: a broken cache file costs re-scrapes, never the start
+        if not os.path.exists(self.path):
+            return
+        cutoff = time.time() - self.ttl
+        stale = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        stale += 1
+                        continue
+                    if not (isinstance(entry, dict) and isinstance(entry.get('key'), str)
+                            and isinstance(entry.get('ts'), (int, float)) and 'content' in entry):
+                        stale += 1  # valid JSON, but not one of our {key, ts, content} lines
+                    elif entry['ts'] >= cutoff:
+                        stale += entry['key'] in self._entries
+                        self._entries[entry['key']] = entry
+                    else:
+                        stale += 1
+        except OSError as e:
+            print(f"   ⚠️ Scrape-Cache konnte nicht gelesen werden, starte leer: {e}")
+            self._entries = {}
+            return
+        if stale:
+            tmp_file = f"{self.path}.tmp"
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(b''.join(orjson.dumps(entry) + b'\n' for entry in self._entries.values()))
+                os.replace(tmp_file, self.path)
+            except OSError as e:
+                print(f"   ⚠️ Scrape-Cache konnte nicht kompaktiert werden: {e}")
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry['ts'] >= self.ttl:
+            return None
+        return entry['content']
+
+    def set(self, key, content):
+        entry = {'key': key, 'ts': time.time(), 'content': content}
+        with self._lock:
+            self._entries[key] = entry
+            try:
+                with open(self.path, 'ab') as f:
+                    f.write(orjson.dumps(entry) + b'\n')
+            except OSError as e:
+                print(f"   ⚠️ Scrape-Cache konnte nicht gespeichert werden: {e}")
+
+
+# User-Agent für bessere Akzeptanz beim Scrapen von Job-Seiten (scrape_with_strategy)
+_SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Worker processes for rendering several PDFs at once (top jobs, selected jobs); rendering is CPU-bound
+# and holds the GIL. Each worker builds its own helper, the hunter's one isn't picklable.
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+_pdf_helper = None
+
+
+def _init_pdf_worker():
+    global _pdf_helper
+    _pdf_helper = TurboBewerbungsHelfer(use_chatgpt=False)
+
+
+def _render_pdf_worker(anschreiben, pdf_path, description, job_data):
+    try:
+        return _pdf_helper.create_professional_pdf(anschreiben, pdf_path, description, job_data)
+    except Exception as e:
+        print(f"❌ PDF-Fehler ({os.path.basename(pdf_path)}): {e}")
+        return False
+
+
+def _get_pdf_pool():
+    global _pdf_pool
+    # Selected jobs are saved from several threads; only one of them may start the pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4), initializer=_init_pdf_worker)
+        return _pdf_pool
+
+
+def _discard_pdf_pool(pool):
+    """Drop a broken pool (failed initializer, dead worker) so the next render starts a fresh one"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Draft API (draft_api.py) that relays the GUI's job selection and approval; each
+# hand-off GET long-polls for up to _HANDOFF_POLL_SECONDS
+DRAFT_API_URL = os.environ.get('DRAFT_API_URL', 'http://localhost:8000')
+_HANDOFF_POLL_SECONDS = 10
+
+# Deutsche Firmenanschriften (save_application / run_manual)
+_PLZ_CITY_COMMA_RE = re.compile(r'(\d{5})\s+([A-ZÄÖÜ][a-zäöüß\-\s]+?)(?:,|$)')
+_NO_COMMA_ADDRESS_RE = re.compile(r'^(.+?\s+\d+[a-z]?)\s+(\d{5})\s+(.+)$')
+_PLZ_CITY_LINE_RE = re.compile(r'(\d{5})\s+(.+)')
+_PLZ_CITY_PREFIX_RE = re.compile(r'(\d{4,5})\s+(.+)')
+_PLZ_TOKEN_RE = re.compile(r'^\d{4,5}$')
+
+
+@lru_cache(maxsize=4096)
+def _split_single_line_address(address):
+    """(street, postal_code, city) from "Straße 1, 12345 Stadt" or "Straße 1 12345 Stadt"
+
+    Parts that can't be parsed are returned as empty strings. Cached: the same user and
+    company addresses come back for every job of a batch.
+    """
+    street = postal_code = city = ''
+    
+    # FORMAT 1: "Street, PLZ City" (with comma)
+    if ',' in address:
+        parts = [part.strip() for part in address.split(',')]
+        if len(parts) >= 2:
+            street = parts[0]
+            plz_city_match = _PLZ_CITY_PREFIX_RE.match(parts[1])
+            if plz_city_match:
+                postal_code = plz_city_match.group(1)
+                city = plz_city_match.group(2).strip()
+    
+    # FORMAT 2: "Street HouseNumber PLZ City" (without comma)
+    if not street and not city:
+        parts = address.split()
+        for i, part in enumerate(parts):
+            if _PLZ_TOKEN_RE.match(part):
+                if i > 0:
+                    street = ' '.join(parts[:i])
+                    postal_code = part
+                    city = ' '.join(parts[i + 1:])
+                break
+    
+    return street, postal_code, city
+
+
+def _din5008_address_block(street, postal_code, city):
+    """Straße / PLZ Ort als zweizeiliger DIN 5008 Block, None ohne Straße und Ort/PLZ"""
+    if not (street and (city or postal_code)):
+        return None
+    if postal_code and city:
+        return f"{street}\n{postal_code} {city}"
+    return f"{street}\n{city or postal_code}"
+
+
+# Remote-Hinweise in Stellenbeschreibungen (_prepare_top_job), wie bisher als Teilstring
+_REMOTE_TERMS_RE = re.compile(r'hybrid|remote|home ?office', re.IGNORECASE)
+
+# scrape_with_strategy stops downloading a page after this many (decoded) bytes
+_SCRAPE_MAX_BYTES = 256_000
+
+# Tags removed before extracting text (scrape_with_strategy / scrape_stepstone_job_details)
+_SECTION_NOISE_TAGS = frozenset({'script', 'style', 'nav', 'header', 'footer'})
+_STEPSTONE_NOISE_TAGS = _SECTION_NOISE_TAGS | {'aside'}
+_PAGE_NOISE_TAGS = _STEPSTONE_NOISE_TAGS | {'advertisement'}
+
+# CSS selectors compiled once; tried in priority order, so they are not joined into one
+# selector group (that would match in document order instead)
+_JOB_CONTENT_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    '.job-description', '.job-content', '.jobad-content',
+    '[data-testid="job-description"]', '.description',
+    'main', 'article', '.content'
+))
+_STEPSTONE_DESCRIPTION_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    '[data-testid="job-description"]',
+    '.job-description',
+    '#job-description',
+    '.jobad-content',
+    '.job-content',
+    'main section',
+    'article'
+))
+
+# Scraped job pages are reused for a day across hunts and profiles
+SCRAPE_CACHE_FILE = '.scrape_cache.jsonl'
+SCRAPE_CACHE_TTL = 24 * 3600
+
+# Background writer: after the first queued write, wait this long for more before writing the batch
+_WRITE_BATCH_WINDOW = 0.05
+_WRITE_BATCH_MAX = 256
+
+# JSON events emitted back-to-back inside batched_json_events() are written together, at
+# most this many per write; every other event is written as soon as it is emitted
+_EVENT_BUFFER_MAX = 16
+# Events the GUI acts on right away are written (with everything before them) even in a batch
+_EVENT_FLUSH_TYPES = frozenset({'final_results', 'error'})
+
+
+
+class _LineAtomicStdout:
+    """stdout wrapper for --json-output: every thread's text goes out in whole lines
+
+    print() writes its text and the newline separately, so with worker threads printing
+    a JSON event (or another thread's line) could land in the middle of a line. Each
+    thread's output is held until its newline and then written under one lock. There is
+    deliberately no .buffer, so emit_json_event writes through here as well.
+    """
+
+    buffer = None
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._pending = {}  # thread id -> text after that thread's last newline
+
+    def write(self, text):
+        thread_id = threading.get_ident()
+        with self._lock:
+            head, newline, tail = (self._pending.pop(thread_id, '') + text).rpartition('\n')
+            if tail:
+                self._pending[thread_id] = tail
+            if newline:
+                self._stream.write(head + newline)
+        return len(text)
+
+    def flush(self):
+        with self._lock:
+            self._stream.flush()
+
+    def close_pending(self):
+        """Write out unterminated text (at exit), one line per thread"""
+        with self._lock:
+            for tail in self._pending.values():
+                self._stream.write(tail + '\n')
+            self._pending.clear()
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# Columns of data/job_matching_dataset.csv (training data for the job scorer)
+TRAINING_FIELDNAMES = ['job_id', 'title', 'description', 'skills', 'location',
+                       'salary', 'company_size', 'remote', 'years_experience', 'match_label']
+
+
+# Common skill keywords to look for in job titles and descriptions
+SKILL_KEYWORDS = (
+    # Technical skills
+    'python', 'javascript', 'react', 'angular', 'vue', 'nodejs', 'java', 'c++', 'c#',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'docker', 'kubernetes',
+    'aws', 'azure', 'gcp', 'terraform', 'ansible',
+    
+    # Marketing skills
+    'seo', 'sem', 'google ads', 'facebook ads', 'social media', 'content marketing',
+    'email marketing', 'analytics', 'google analytics', 'performance marketing',
+    'digital marketing', 'marketing automation', 'crm',
+    
+    # E-commerce skills
+    'shopify', 'woocommerce', 'magento', 'amazon', 'ebay', 'marketplace',
+    'e-commerce', 'ecommerce', 'online shop', 'conversion optimization',
+    
+    # General skills
+    'project management', 'agile', 'scrum', 'kanban', 'jira', 'confluence',
+    'communication', 'teamwork', 'leadership', 'problem solving'
+)
+# (keyword, lower-cased keyword) pairs, so matching never lower-cases per call
+_SKILL_KEYWORDS_LOWER = tuple((skill, skill.lower()) for skill in SKILL_KEYWORDS)
+
+
+def _build_skill_automaton(keywords):
+    """Aho-Corasick automaton over (keyword, lower-cased keyword) pairs (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, lowered in keywords:
+        automaton.add_word(lowered, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_skill_automaton(_SKILL_KEYWORDS_LOWER)
+
+# scrape_stepstone_job_details: section keywords in priority order (first one found wins)
+_REQUIREMENTS_KEYWORDS = ('anforderungen', 'requirements', 'qualifikation', 'erfahrung', 'skills', 'kenntnisse')
+_BENEFITS_KEYWORDS = ('benefits', 'vorteile', 'bieten wir', 'unser angebot', 'was wir bieten')
+_SECTION_AUTOMATON = _build_skill_automaton(
+    tuple((keyword, keyword) for keyword in _REQUIREMENTS_KEYWORDS + _BENEFITS_KEYWORDS)
+)
+
+
+def _first_keyword_positions(text_lower):
+    """keyword -> index of its first occurrence, for the section keywords found in *text_lower*"""
+    if _SECTION_AUTOMATON is None:
+        positions = {}
+        for keyword in _REQUIREMENTS_KEYWORDS + _BENEFITS_KEYWORDS:
+            start = text_lower.find(keyword)
+            if start != -1:
+                positions[keyword] = start
+        return positions
+    positions = {}
+    for end, keyword in _SECTION_AUTOMATON.iter(text_lower):
+        positions.setdefault(keyword, end - len(keyword) + 1)
+    return positions
+
+
+def _join_clean_lines(text, sep, limit):
+    """sep.join() of the stripped non-empty lines of *text*, cut to *limit* chars
+
+    Stops stripping lines once the result is long enough instead of cleaning the whole page.
+    """
+    parts = []
+    size = -len(sep)
+    for line in text.split('\n'):
+        line = line.strip()
+        if line:
+            parts.append(line)
+            size += len(sep) + len(line)
+            if size >= limit:
+                break
+    return sep.join(parts)[:limit]
+
+
+def _bullet_list(value):
+    return '\n'.join([f"• {item}" for item in value]) if isinstance(value, list) else value
+
+
+def _comma_list(value):
+    return ', '.join(value) if isinstance(value, list) else value
+
+
+def _key_value_list(value):
+    return ', '.join([f"{k}: {v}" for k, v in value.items() if v]) if isinstance(value, dict) else value
+
+
+def _jsearch_salary(job):
+    if job.get('job_min_salary') and job.get('job_max_salary'):
+        currency = job.get('job_salary_currency', 'USD')
+        period = job.get('job_salary_period', 'year')
+        return f"{job['job_min_salary']:,} - {job['job_max_salary']:,} {currency} per {period}"
+    if job.get('job_salary'):
+        return str(job['job_salary'])
+    return None
+
+
+def _adzuna_salary(job):
+    # Gehaltsinformationen (mit Hinweis ob geschätzt)
+    if not (job.get('salary_min') or job.get('salary_max')):
+        return None
+    salary_info = []
+    if job.get('salary_min'): salary_info.append(f"ab {job['salary_min']}€")
+    if job.get('salary_max'): salary_info.append(f"bis {job['salary_max']}€")
+    salary_text = ' '.join(salary_info)
+    if job.get('salary_is_predicted'):
+        salary_text += " (geschätzt)"
+    return salary_text
+
+
+def _adzuna_coordinates(job):
+    if job.get('latitude') and job.get('longitude'):
+        return f"{job['latitude']:.4f}, {job['longitude']:.4f}"
+    return None
+
+
+def _adzuna_company_details(job):
+    # Falls Adzuna mehr Firmendaten hat als nur display_name
+    company_data = job.get('company_data', {})
+    if not (isinstance(company_data, dict) and len(company_data) > 1):
+        return None
+    company_details = [f"{key}: {value}" for key, value in company_data.items()
+                       if key != 'display_name' and key != '__CLASS__' and value]
+    return ', '.join(company_details) if company_details else None
+
+
+def _jsearch_highlights(job):
+    # Job-Highlights (oft sehr detailliert!)
+    highlights_data = job.get('job_highlights')
+    if not isinstance(highlights_data, dict):
+        return None
+    sections = [f"\n{section.title()}:\n{_bullet_list(items)}"
+                for section, items in highlights_data.items() if items]
+    return '\n'.join(sections) if sections else None
+
+
+def _append_api_field(content_parts, job, prefix, key, fmt):
+    """Append one API field: *key* is looked up on the job (skipped if empty), or with
+    key=None *fmt* builds the text from the whole job (skipped if it returns None)."""
+    if key is None:
+        text = fmt(job)
+        if text is None:
+            return
+    else:
+        value = job.get(key)
+        if not value:
+            return
+        text = fmt(value) if fmt else value
+    content_parts.append(f"{prefix}{text}")
+
+
+# build_api_content: (prefix, job key, formatter) per platform, before the description ...
+_API_CONTENT_FIELDS = {
+    'JSearch': (
+        # ERWEITERTE Firmeninformationen
+        ("Firmen-Website: ", 'employer_website', None),
+        ("Unternehmenstyp: ", 'employer_company_type', None),
+        ("Veröffentlicht über: ", 'job_publisher', None),
+        # DETAILLIERTE Gehaltsinformationen
+        ("Gehalt: ", None, _jsearch_salary),
+        # Arbeitszeit und Remote-Optionen
+        ("Arbeitszeit: ", 'job_employment_type', None),
+        ("Remote-Arbeit: ", 'job_is_remote', lambda remote: 'Ja' if remote else 'Nein'),
+        ("Veröffentlicht: ", 'job_posted_at', None),
+    ),
+    'Adzuna': (
+        ("Gehalt: ", None, _adzuna_salary),
+        # Vertragsart und Kategorie
+        ("Vertragsart: ", 'contract_type', None),
+        ("Kategorie: ", 'category_label', None),
+        # Zeitstempel und Job-ID
+        ("Veröffentlicht: ", 'created', None),
+        ("Job-ID: ", 'job_id', None),
+        # Geografische Details
+        ("Koordinaten: ", None, _adzuna_coordinates),
+        # Erweiterte Firmendaten
+        ("Firmendetails: ", None, _adzuna_company_details),
+    ),
+}
+
+# ... and after it
+_API_CONTENT_DETAIL_FIELDS = {
+    'JSearch': (
+        # VOLLSTÄNDIGE Benefits-Liste (nicht nur 3!)
+        ("\nBenefits und Zusatzleistungen:\n", 'job_benefits', _bullet_list),
+        ("\nAnforderungen und Qualifikationen:\n", 'job_qualifications', None),
+        ("\nErfahrungsanforderungen:\n", 'job_required_experience', _key_value_list),
+        ("\nErforderliche Skills:\n", 'job_required_skills', _comma_list),
+        ("\nBildungsanforderungen:\n", 'job_required_education', _key_value_list),
+        ("", None, _jsearch_highlights),
+    ),
+}
+
+
 class UltimateJobHunter:
     def __init__(self, skip_stepstone: bool = True, json_output: bool = False):  # Stepstone standardmäßig deaktiviert
         """Initialisiert Ultimate Job Hunter"""
@@ -125,21 +658,48 @@ class UltimateJobHunter:
         self.process_status = "idle"           # idle, running, paused, cancelled, completed
         self.process_lock = threading.Lock()   # Thread-safe status updates
         self.last_search_cache = {}            # Cache for rewrite functionality
+        self._api_content_cache = {}           # (platform, job_id) -> build_api_content result
         
-        # Bewerbungshelfer
-        self.bewerbungshelfer = TurboBewerbungsHelfer(
-            use_chatgpt=True, 
-            chatgpt_api_key=self.openai_api_key
-        )
+        # Bewerbungshelfer (je Worker-Thread eine eigene Instanz, siehe bewerbungshelfer)
+        helper_kwargs = {'use_chatgpt': True, 'chatgpt_api_key': self.openai_api_key}
+        self._bewerbungshelfer = TurboBewerbungsHelfer(**helper_kwargs)
+        self._helper_factory = lambda: TurboBewerbungsHelfer(**helper_kwargs)
+        self._helper_owner = threading.get_ident()
+        self._helper_local = threading.local()
         
         # Session
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        # Larger keep-alive pool (default: 10) plus a short retry on connection errors and
+        # transient statuses; the last response is returned instead of raising, so callers
+        # still see the status code
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=(429, 500, 502, 503, 504),
+                                                raise_on_status=False))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._scrape_cache = _ScrapeCache(SCRAPE_CACHE_FILE, SCRAPE_CACHE_TTL)
+        
+        # Keep-alive connection to the local draft API for the hand-off long-polls (see
+        # _wait_for_handoff); no adapter retries, the poll loop already retries every second
+        self._handoff_session = requests.Session()
+        self._handoff_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
         
         # Processed Jobs - Legacy and New System
         self.processed_jobs_file = 'processed_jobs.json'
+        self.processed_jobs_log = 'processed_jobs.jsonl'  # append-only, one completed job per line
+        self._job_index = {}          # job_id -> job from the profile cache, for get_job_by_id
+        self._job_index_key = None    # (mtime_ns, size) of the file the index was built from
+        
+        # Training data CSV, opened on first use and kept open (see _ensure_training_writer)
+        self._training_fh = None
+        self._training_writer = None
+        self._train_total = 0       # labeled samples in the CSV, see _init_training_counters
+        self._train_positive = 0
+        
         self.processed_jobs = self.load_processed_jobs()
         
         # Initialize Profile-Specific Job Cache
@@ -155,50 +715,127 @@ class UltimateJobHunter:
         )
         
         self.job_ranker = JobRanker()
+        self._rankers = {}  # (weights fields, id(profile)) -> (profile, JobRanker), see _get_ranker
+        
+        # 📊 One AnalyticsManager (and DB connection) for the whole session, created and
+        # used only by the writer thread
+        self._analytics = None
+        self._analytics_error = _ANALYTICS_IMPORT_ERROR
+        
+        # Processed-jobs log, training CSV and analytics writes are queued and done by a
+        # single background thread, so approvals don't wait on disk (see flush())
+        self._write_q = queue.Queue()
+        self._writer_thr = threading.Thread(target=self._writer_loop, name='job-hunter-writer', daemon=True)
+        self._writer_thr.start()
+        atexit.register(self._shutdown_writer)
+
+        # Pending emit_json_event lines, written by emit_json_event / flush_json_events only
+        # (never from a helper thread, which could cut into a half-written print() line)
+        self._event_buf = []
+        self._event_lock = threading.Lock()
+        self._event_batch_depth = 0
+        atexit.register(self.flush_json_events)
+
+    @property
+    def bewerbungshelfer(self):
+        """Der TurboBewerbungsHelfer des aufrufenden Threads
+
+        Der Helfer (LLM-Client, Adresssuche) ist nicht als thread-safe bekannt. Die
+        Worker-Threads von process_top_jobs / _process_selected_jobs_impl bekommen deshalb
+        je eine eigene Instanz (wie _get_turbo in draft_api), der Thread, der den Hunter
+        erzeugt hat, nutzt die ursprüngliche.
+        """
+        if threading.get_ident() == self._helper_owner:
+            return self._bewerbungshelfer
+        helper = getattr(self._helper_local, 'helper', None)
+        if helper is None:
+            helper = self._helper_local.helper = self._helper_factory()
+        return helper
+
+    @bewerbungshelfer.setter
+    def bewerbungshelfer(self, helper):
+        # Ein von außen gesetzter Helfer lässt sich nicht nachbauen und wird geteilt
+        self._bewerbungshelfer = helper
+        self._helper_factory = lambda: helper
+        self._helper_local = threading.local()
 
     def load_processed_jobs(self):
         """Lade bereits verarbeitete Jobs"""
-        if os.path.exists(self.processed_jobs_file):
-            try:
-                with open(self.processed_jobs_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    # Handle both old format (list of URLs) and new format (list of objects)
-                    if isinstance(data, list):
-                        if data and isinstance(data[0], dict):
-                            # New format with metadata
-                            self.processed_jobs = {self.normalize_job_url(job.get('url', job.get('job_id', ''))) 
-                                                 for job in data}
-                        else:
-                            # Old format - just URLs
-                            self.processed_jobs = {self.normalize_job_url(url) for url in data}
-                    else:
-                        self.processed_jobs = set()
-                        
-            except Exception as e:
-                print(f"❌ Fehler beim Laden der processed_jobs: {e}")
-                self.processed_jobs = set()
-        else:
+        try:
+            if not os.path.exists(self.processed_jobs_log):
+                self._migrate_processed_jobs()
+            self.processed_jobs = {self._processed_entry_id(job) for job in self._read_processed_log()}
+        except Exception as e:
+            print(f"❌ Fehler beim Laden der processed_jobs: {e}")
             self.processed_jobs = set()
+        # processed_jobs is shared with the search manager; this copy tracks exactly what is in the log
+        self._logged_job_ids = set(self.processed_jobs)
 
         # Always return the processed_jobs set for external consumers
         return self.processed_jobs
 
+    def _processed_entry_id(self, entry):
+        """Normalized id of a processed_jobs.jsonl entry (stored as _nid since it is written)"""
+        return entry.get('_nid') or self.normalize_job_url(entry.get('url') or entry.get('job_id', ''))
+
+    def _read_processed_log(self):
+        """Yield the entries of processed_jobs.jsonl, skipping a torn last line"""
+        if not os.path.exists(self.processed_jobs_log):
+            return
+        with open(self.processed_jobs_log, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = orjson.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
+
+    def _rewrite_processed_log(self, entries):
+        """Atomically replace processed_jobs.jsonl with *entries*"""
+        tmp_file = f"{self.processed_jobs_log}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.writelines(orjson.dumps(entry) + b'\n' for entry in entries)
+        os.replace(tmp_file, self.processed_jobs_log)
+
+    def _migrate_processed_jobs(self):
+        """One-time conversion of the legacy processed_jobs.json list into processed_jobs.jsonl"""
+        if not os.path.exists(self.processed_jobs_file):
+            return
+        with open(self.processed_jobs_file, 'rb') as f:
+            data = orjson.loads(f.read())
+        # The profile cache keeps its own dict in this file - only the old list format is migrated
+        if not isinstance(data, list):
+            return
+        date_added = datetime.now().isoformat()
+        self._rewrite_processed_log(
+            job if isinstance(job, dict) else {'job_id': job, 'url': job, 'date_added': date_added}
+            for job in data
+        )
+        print(f"   🔄 {len(data)} processed jobs nach {self.processed_jobs_log} migriert")
+
     def get_job_by_id(self, job_id):
         """🎯 NEW: Get job details by job_id for dropdown preview"""
         try:
-            # Load current job data
-            with open(self.processed_jobs_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Search in all profile sections for the job
-            for profile_key, profile_data in data.items():
-                if isinstance(profile_data, dict) and 'jobs' in profile_data:
-                    for job in profile_data['jobs']:
-                        if job.get('job_id') == job_id:
-                            return job
-            
-            return None
+            # Re-index only when the profile cache file changed since the last lookup
+            stat = os.stat(self.processed_jobs_file)
+            index_key = (stat.st_mtime_ns, stat.st_size)
+            if index_key != self._job_index_key:
+                with open(self.processed_jobs_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+                
+                # Index all profile sections; the first profile listing a job wins
+                job_index = {}
+                for profile_key, profile_data in data.items():
+                    if isinstance(profile_data, dict) and 'jobs' in profile_data:
+                        for job in profile_data['jobs']:
+                            job_index.setdefault(job.get('job_id'), job)
+                self._job_index = job_index
+                self._job_index_key = index_key
+            
+            return self._job_index.get(job_id)
         except Exception as e:
             logger.error(f"Error getting job by ID {job_id}: {e}")
             return None
@@ -208,8 +845,11 @@ class UltimateJobHunter:
         print("⚠️ WARNING: save_processed_job is deprecated. Use mark_job_as_completed.")
         return self.mark_job_as_completed(url, user_approved=True)
 
-    def mark_job_as_completed(self, job_id, user_approved=True, job_data=None):
-        """🎯 Neue Funktion: Markiert Job als abgeschlossen nur nach User-Approval"""
+    def mark_job_as_completed(self, job_id, user_approved=True, job_data=None, now_iso=None):
+        """🎯 Neue Funktion: Markiert Job als abgeschlossen nur nach User-Approval
+
+        now_iso: Zeitstempel für date_added - Batch-Aufrufer übergeben einen gemeinsamen Wert
+        """
         # Save training data first (regardless of approval status)
         self._save_training_data(job_id, user_approved, job_data)
         
@@ -218,55 +858,42 @@ class UltimateJobHunter:
             return False
         
         # Job zur processed Liste hinzufügen
-        normalized_id = self.normalize_job_url(job_id)
+        # Jobs from search_all_sources carry their normalized id already
+        if job_data and job_data.get('_nid') and job_data.get('job_id') == job_id:
+            normalized_id = job_data['_nid']
+        else:
+            normalized_id = self.normalize_job_url(job_id)
+        job_exists = normalized_id in self._logged_job_ids
+        self._logged_job_ids.add(normalized_id)
         self.processed_jobs.add(normalized_id)
         
         try:
-            # Load existing data
-            if os.path.exists(self.processed_jobs_file):
-                with open(self.processed_jobs_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            else:
-                existing_data = []
-            
-            # Convert old format to new format if needed
-            if existing_data and not isinstance(existing_data[0], dict):
-                # Old format - convert to new format
-                existing_data = [{'job_id': url, 'url': url, 'date_added': datetime.now().isoformat()} 
-                               for url in existing_data]
-            
-            # Add new job with metadata
-            new_entry = {
-                'job_id': job_id,
-                'url': job_id if job_id.startswith('http') else None,
-                'date_added': datetime.now().isoformat(),
-                'user_approved': user_approved
-            }
-            
-            # Add additional job data if provided
-            if job_data:
-                new_entry.update({
-                    'company': job_data.get('company'),
-                    'title': job_data.get('title'),
-                    'location': job_data.get('location'),
-                    'platform': job_data.get('platform')
-                })
-            
-            # Check if job already exists
-            job_exists = any(job.get('job_id') == job_id or job.get('url') == job_id 
-                           for job in existing_data if isinstance(job, dict))
-            
             if not job_exists:
-                existing_data.append(new_entry)
-            
-            # Save updated data
-            with open(self.processed_jobs_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+                # Add new job with metadata
+                new_entry = {
+                    'job_id': job_id,
+                    'url': job_id if job_id.startswith('http') else None,
+                    'date_added': now_iso or datetime.now().isoformat(),
+                    'user_approved': user_approved,
+                    '_nid': normalized_id
+                }
+                
+                # Add additional job data if provided
+                if job_data:
+                    new_entry.update({
+                        'company': job_data.get('company'),
+                        'title': job_data.get('title'),
+                        'location': job_data.get('location'),
+                        'platform': job_data.get('platform')
+                    })
+                
+                # Appended to the processed_jobs.jsonl log by the writer thread
+                self._write_q.put(('processed', new_entry))
                 
             # 📊 Analytics Integration - Add to Analytics DB
             try:
-                from analytics_manager import AnalyticsManager, ApplicationAnalytics
-                analytics = AnalyticsManager()
+                if AnalyticsManager is None:
+                    raise RuntimeError(self._analytics_error or "analytics_manager not available")
                 
                 # Create analytics entry for the completed application
                 analytics_entry = ApplicationAnalytics(
@@ -280,8 +907,8 @@ class UltimateJobHunter:
                     status='pending'  # Start with pending status
                 )
                 
-                analytics.add_application(analytics_entry)
-                print(f"   📊 Application added to Analytics DB: {analytics_entry.application_id}")
+                self._write_q.put(('analytics', analytics_entry))
+                print(f"   📊 Application queued for Analytics DB: {analytics_entry.application_id}")
                 
             except Exception as analytics_error:
                 print(f"   ⚠️ Analytics integration failed: {analytics_error}")
@@ -293,26 +920,117 @@ class UltimateJobHunter:
             print(f"   ❌ Fehler beim Speichern: {e}")
             return False
     
+    def _ensure_training_writer(self):
+        """Open data/job_matching_dataset.csv once for appending and reuse the DictWriter"""
+        if self._training_writer is not None:
+            return self._training_writer
+        
+        # Ensure data directory exists
+        data_dir = Path('data')
+        data_dir.mkdir(exist_ok=True)
+        
+        csv_file = data_dir / 'job_matching_dataset.csv'
+        
+        # A missing or empty CSV needs the header row - one stat() instead of reading the file
+        try:
+            write_header = os.stat(csv_file).st_size == 0
+        except FileNotFoundError:
+            write_header = True
+        
+        self._init_training_counters(csv_file)
+        
+        self._training_fh = open(csv_file, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+        writer = csv.DictWriter(self._training_fh, fieldnames=TRAINING_FIELDNAMES)
+        if write_header:
+            writer.writeheader()
+        self._training_writer = writer
+        return writer
+    
+    def _init_training_counters(self, csv_file):
+        """Count the labeled samples already on disk once; later rows update the counters"""
+        self._train_total = 0
+        self._train_positive = 0
+        if not csv_file.exists():
+            return
+        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                self._train_total += 1
+                self._train_positive += row.get('match_label') == '1'
+    
+    def _close_training_writer(self):
+        if self._training_fh is not None:
+            self._training_fh.close()
+            self._training_fh = None
+            self._training_writer = None
+    
+    def _writer_loop(self):
+        """Background writer: drain _write_q in batches and do the actual file/DB writes"""
+        if AnalyticsManager is not None:
+            try:
+                self._analytics = AnalyticsManager()
+            except Exception as analytics_error:
+                self._analytics_error = str(analytics_error)
+        
+        while True:
+            batch = [self._write_q.get()]
+            deadline = time.monotonic() + _WRITE_BATCH_WINDOW
+            while len(batch) < _WRITE_BATCH_MAX:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._write_q.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+    
+    def _write_batch(self, batch):
+        """Write one batch of queued ('processed' | 'training' | 'analytics', item) pairs"""
+        processed = [item for kind, item in batch if kind == 'processed']
+        training_rows = [item for kind, item in batch if kind == 'training']
+        
+        if processed:
+            try:
+                # Append-only log: one line per completed job instead of rewriting the whole file
+                with open(self.processed_jobs_log, 'ab') as f:
+                    f.write(b''.join(orjson.dumps(entry) + b'\n' for entry in processed))
+            except Exception as e:
+                print(f"   ❌ Fehler beim Speichern: {e}")
+        
+        if training_rows:
+            try:
+                # One flush per batch keeps the rows a single append, so rows from another
+                # running instance cannot interleave with a partial buffer
+                self._training_writer.writerows(training_rows)
+                self._training_fh.flush()
+            except Exception as e:
+                print(f"   ⚠️ Could not save training data: {e}")
+        
+        for kind, entry in batch:
+            if kind != 'analytics':
+                continue
+            try:
+                if self._analytics is None:
+                    raise RuntimeError(self._analytics_error or "analytics_manager not available")
+                self._analytics.add_application(entry)
+            except Exception as analytics_error:
+                print(f"   ⚠️ Analytics integration failed: {analytics_error}")
+    
+    def flush(self):
+        """Block until every queued processed-job, training and analytics write is done"""
+        self._write_q.join()
+    
+    def _shutdown_writer(self):
+        self.flush()
+        self._close_training_writer()
+    
     def _save_training_data(self, job_id, user_approved, job_data):
         """💾 Save training data for ML model (Task 42.1)"""
         try:
-            import csv
-            from pathlib import Path
-            
-            # Ensure data directory exists
-            data_dir = Path('data')
-            data_dir.mkdir(exist_ok=True)
-            
-            csv_file = data_dir / 'job_matching_dataset.csv'
-            
-            # Check if CSV exists and has headers
-            write_header = not csv_file.exists()
-            if csv_file.exists():
-                # Check if file is empty or only has header
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    write_header = not content or content.count('\n') == 0
-            
             # Prepare job data for CSV
             if job_data:
                 # Extract skills from job description using simple heuristics
@@ -332,56 +1050,32 @@ class UltimateJobHunter:
                     'match_label': 1 if user_approved else 0
                 }
                 
-                # Append to CSV
-                with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-                    fieldnames = ['job_id', 'title', 'description', 'skills', 'location', 
-                                'salary', 'company_size', 'remote', 'years_experience', 'match_label']
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    
-                    if write_header:
-                        writer.writeheader()
-                    
-                    writer.writerow(training_row)
+                # Open the CSV (and count existing samples) here; the writer thread appends
+                # the row and flushes once per batch
+                self._ensure_training_writer()
+                self._write_q.put(('training', training_row))
                 
                 print(f"   📊 Training data saved: label={training_row['match_label']} for {job_data.get('title', job_id)}")
                 
+                self._train_total += 1
+                self._train_positive += training_row['match_label']
+                
                 # Check if we have enough data to suggest training
-                self._check_training_readiness(csv_file)
+                self._check_training_readiness()
                 
         except Exception as e:
             print(f"   ⚠️ Could not save training data: {e}")
     
     def _extract_skills_from_job(self, job_data):
         """🧠 Extract skills from job data using simple keyword matching"""
-        skills = []
-        
-        # Common skill keywords to look for
-        skill_keywords = [
-            # Technical skills
-            'python', 'javascript', 'react', 'angular', 'vue', 'nodejs', 'java', 'c++', 'c#',
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'docker', 'kubernetes',
-            'aws', 'azure', 'gcp', 'terraform', 'ansible',
-            
-            # Marketing skills
-            'seo', 'sem', 'google ads', 'facebook ads', 'social media', 'content marketing',
-            'email marketing', 'analytics', 'google analytics', 'performance marketing',
-            'digital marketing', 'marketing automation', 'crm',
-            
-            # E-commerce skills
-            'shopify', 'woocommerce', 'magento', 'amazon', 'ebay', 'marketplace',
-            'e-commerce', 'ecommerce', 'online shop', 'conversion optimization',
-            
-            # General skills
-            'project management', 'agile', 'scrum', 'kanban', 'jira', 'confluence',
-            'communication', 'teamwork', 'leadership', 'problem solving'
-        ]
-        
         # Search in title and description
         text_to_search = f"{job_data.get('title', '')} {job_data.get('description', '')}".lower()
         
-        for skill in skill_keywords:
-            if skill.lower() in text_to_search:
-                skills.append(skill)
+        if _SKILL_AUTOMATON is not None:
+            # One pass over the text finds every (overlapping) keyword
+            skills = [skill for _, skill in _SKILL_AUTOMATON.iter(text_to_search)]
+        else:
+            skills = [skill for skill, lowered in _SKILL_KEYWORDS_LOWER if lowered in text_to_search]
         
         # Also check job_required_skills if available
         if job_data.get('job_required_skills'):
@@ -393,17 +1087,11 @@ class UltimateJobHunter:
         
         return list(set(skills))  # Remove duplicates
     
-    def _check_training_readiness(self, csv_file):
+    def _check_training_readiness(self):
         """🎯 Check if we have enough data for training and suggest it"""
         try:
-            import csv
-            
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-            
-            total_samples = len(rows)
-            positive_samples = sum(1 for row in rows if row.get('match_label') == '1')
+            total_samples = self._train_total
+            positive_samples = self._train_positive
             
             # Suggest training at certain milestones
             if total_samples in [50, 100, 150, 200, 300, 500] or (total_samples > 500 and total_samples % 100 == 0):
@@ -422,20 +1110,25 @@ class UltimateJobHunter:
             pass
     
     def reset_job_cache(self):
-        """🎯 Neue Funktion: Reset der processed_jobs.json"""
+        """🎯 Neue Funktion: Reset der processed_jobs.json / processed_jobs.jsonl"""
+        # Pending appends would otherwise land in the freshly cleared log
+        self.flush()
         try:
             # Backup erstellen
-            import shutil
-            from datetime import datetime
-            backup_file = f"processed_jobs_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            if os.path.exists(self.processed_jobs_file):
-                shutil.copy2(self.processed_jobs_file, backup_file)
-                print(f"   💾 Backup erstellt: {backup_file}")
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            for path in (self.processed_jobs_file, self.processed_jobs_log):
+                if os.path.exists(path):
+                    root, ext = os.path.splitext(path)
+                    backup_file = f"{root}_backup_{timestamp}{ext}"
+                    shutil.copy2(path, backup_file)
+                    print(f"   💾 Backup erstellt: {backup_file}")
             
             # Cache leeren
             self.processed_jobs = set()
+            self._logged_job_ids = set()
             with open(self.processed_jobs_file, 'w', encoding='utf-8') as f:
                 json.dump([], f, indent=2)
+            open(self.processed_jobs_log, 'w', encoding='utf-8').close()
             
             print("   ✅ Job-Cache erfolgreich geleert")
             return True
@@ -444,43 +1137,32 @@ class UltimateJobHunter:
             return False
 
     def clean_expired_jobs(self, max_age_days=30):
-        """🧹 Entferne Jobs älter als max_age_days aus processed_jobs.json"""
+        """🧹 Entferne Jobs älter als max_age_days aus processed_jobs.jsonl (Kompaktierung)"""
+        self.flush()
         try:
-            if not os.path.exists(self.processed_jobs_file):
+            if not os.path.exists(self.processed_jobs_log):
                 return 0
             
-            with open(self.processed_jobs_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = list(self._read_processed_log())
             
-            if not isinstance(data, list):
-                return 0
-            
-            # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=max_age_days)
+            # Calculate cutoff date - date_added is written by datetime.isoformat(), and
+            # zero-padded ISO-8601 timestamps sort lexicographically, so compare strings
+            cutoff_iso = (datetime.now() - timedelta(days=max_age_days)).isoformat()
             initial_count = len(data)
             
-            # Filter jobs
-            filtered_data = []
-            for item in data:
-                if isinstance(item, dict) and 'date_added' in item:
-                    try:
-                        job_date = datetime.fromisoformat(item['date_added'].replace('Z', '+00:00'))
-                        if job_date > cutoff_date:
-                            filtered_data.append(item)
-                    except:
-                        # Keep jobs with invalid dates
-                        filtered_data.append(item)
-                else:
-                    # Keep old format entries (can't determine age)
-                    filtered_data.append(item)
+            # Filter jobs; entries without a (string) date are kept since their age is unknown
+            filtered_data = [
+                item for item in data
+                if not (isinstance(item.get('date_added'), str) and item['date_added'][:1].isdigit()
+                        and item['date_added'] < cutoff_iso)
+            ]
             
             # Save filtered data
-            with open(self.processed_jobs_file, 'w', encoding='utf-8') as f:
-                json.dump(filtered_data, f, indent=2, ensure_ascii=False)
+            self._rewrite_processed_log(filtered_data)
             
             # Update in-memory set
-            self.processed_jobs = {self.normalize_job_url(job.get('url', job.get('job_id', ''))) 
-                                 for job in filtered_data if isinstance(job, dict)}
+            self.processed_jobs = {self._processed_entry_id(job) for job in filtered_data}
+            self._logged_job_ids = set(self.processed_jobs)
             
             removed_count = initial_count - len(filtered_data)
             print(f"   🧹 {removed_count} Jobs älter als {max_age_days} Tage entfernt")
@@ -490,15 +1172,11 @@ class UltimateJobHunter:
             print(f"   ❌ Fehler beim Bereinigen: {e}")
             return 0
 
-    def normalize_job_url(self, url):
-        """🔧 Normalisiere Job-URL / Job-ID für Duplikatserkennung - REFACTORED to use job_utils"""
-        from job_utils import normalize_job_url
-        return normalize_job_url(url)
-
-    def remove_gendering(self, title: str) -> str:
-        """🧹 Entferne Gendering aus Jobtiteln - REFACTORED to use job_utils"""
-        from job_utils import remove_gendering
-        return remove_gendering(title)
+    # 🔧 Normalisiere Job-URL / Job-ID für Duplikatserkennung - REFACTORED to use job_utils
+    # 🧹 Entferne Gendering aus Jobtiteln - REFACTORED to use job_utils
+    # Bound directly so hot loops skip the wrapper call and the per-call import
+    normalize_job_url = staticmethod(normalize_job_url)
+    remove_gendering = staticmethod(remove_gendering)
 
     def search_adzuna_api(self, query: str, max_results: int = 5, max_age_days: Optional[int] = None) -> List[Dict[str, Any]]:
         """🌐 Adzuna API-Suche - REFACTORED to use JobSearchManager"""
@@ -537,12 +1215,34 @@ class UltimateJobHunter:
         if not jobs:
             return []
         
-        # Create ranker with custom weights and profile
-        ranker = JobRanker(weights=weights, profile=profile)
+        # Reuse a ranker built for the same weights and profile
+        ranker = self._get_ranker(weights, profile)
         
         # Use the new ranking system
         return ranker.rank_jobs(jobs)
 
+    def _get_ranker(self, weights: RankingWeights = None, profile: SearchProfile = None):
+        """Return a cached JobRanker for these weights/profile, building it on first use"""
+        if weights is None and profile is None:
+            return self.job_ranker
+        
+        # Weights are compared by value, the profile by identity; the cache keeps the
+        # profile referenced so its id() cannot be reused while the entry exists
+        try:
+            weights_key = tuple(sorted(vars(weights).items())) if weights is not None else None
+            key = (weights_key, id(profile))
+            cached = self._rankers.get(key)
+        except TypeError:  # no __dict__ or unhashable weight values
+            return JobRanker(weights=weights, profile=profile)
+        if cached is not None:
+            return cached[1]
+        
+        ranker = JobRanker(weights=weights, profile=profile)
+        if len(self._rankers) >= 16:
+            self._rankers.pop(next(iter(self._rankers)))
+        self._rankers[key] = (profile, ranker)
+        return ranker
+
     def search_all_sources(self, max_jobs=15):
         """🔍 Multi-Source Suche"""
         print(f"🔍 Suche {max_jobs} Jobs aus 3 VOLLSTÄNDIGEN Quellen...")
@@ -555,27 +1255,25 @@ class UltimateJobHunter:
         
         # Dynamische Queries aus preferences.yaml laden
         try:
-            with open('preferences.yaml', 'r', encoding='utf-8') as f:
-                import yaml
-                prefs = yaml.safe_load(f)
-                target_roles = prefs.get('target_roles', [])
-                
-                # Queries aus target_roles generieren
-                queries = []
-                for role in target_roles:
-                    # Bereinige Klammern und zusätzliche Infos
-                    clean_role = role.split('(')[0].strip()
-                    queries.append(clean_role)
-                
-                # Fallback wenn keine Rollen definiert
-                if not queries:
-                    queries = [
-                        "Digital Marketing Manager",
-                        "E-Commerce Manager", 
-                        "Marketing Manager"
-                    ]
-                    
-                print(f"🎯 DYNAMISCHE QUERIES aus preferences.yaml: {queries}")
+            prefs = _load_preferences('preferences.yaml', os.stat('preferences.yaml').st_mtime_ns)
+            target_roles = prefs.get('target_roles', [])
+            
+            # Queries aus target_roles generieren
+            queries = []
+            for role in target_roles:
+                # Bereinige Klammern und zusätzliche Infos
+                clean_role = role.split('(')[0].strip()
+                queries.append(clean_role)
+            
+            # Fallback wenn keine Rollen definiert
+            if not queries:
+                queries = [
+                    "Digital Marketing Manager",
+                    "E-Commerce Manager", 
+                    "Marketing Manager"
+                ]
+                
+            print(f"🎯 DYNAMISCHE QUERIES aus preferences.yaml: {queries}")
                 
         except Exception as e:
             print(f"⚠️ Preferences-Fehler: {e}")
@@ -587,42 +1285,72 @@ class UltimateJobHunter:
             ]
         
         all_jobs = []
+        query_list = queries[:4]  # 4 Queries für beste Abdeckung
         
-        for query in queries[:4]:  # 4 Queries für beste Abdeckung
-            if len(all_jobs) >= max_jobs:
-                break
-            
-            print(f"\n🎯 '{query}'")
-            
-            # Pro Query: mehr Jobs pro Quelle wenn Stepstone deaktiviert
-            jobs_per_source = 7 if self.skip_stepstone else 3  # 7 pro Quelle (nur 2 Quellen) oder 3 pro Quelle (3 Quellen)
-            
-            # 1. Adzuna API - Professionell
-            adzuna_jobs = self.search_adzuna_api(query, jobs_per_source)
-            all_jobs.extend(adzuna_jobs)
-            
-            # 2. JSearch API - Schnell
-            jsearch_jobs = self.search_jsearch_api(query, jobs_per_source)
-            all_jobs.extend(jsearch_jobs)
-            
-            # 3. Stepstone - Premium deutsch (mit Fallback)
-            stepstone_jobs = []
-            if not self.skip_stepstone:
-                print("🔍 STEPSTONE: Browser zuerst, dann HTTP-Fallback")
-                stepstone_jobs = self.search_stepstone_stealth(query, jobs_per_source)
+        # Duplikate (quellen-/query-übergreifend und bereits verarbeitete Jobs) direkt beim Sammeln verwerfen
+        seen_ids = set(self.processed_jobs)
+        
+        def add_jobs(jobs):
+            for job in jobs:
+                # Normalize once on ingest; later stages reuse job['_nid']
+                job_key = job['_nid'] = self.normalize_job_url(job.get('job_id') or job.get('url', ''))
+                if job_key and job_key not in seen_ids:
+                    seen_ids.add(job_key)
+                    all_jobs.append(job)
+        
+        # Pro Query: mehr Jobs pro Quelle wenn Stepstone deaktiviert
+        jobs_per_source = 7 if self.skip_stepstone else 3  # 7 pro Quelle (nur 2 Quellen) oder 3 pro Quelle (3 Quellen)
+        
+        # API-Aufrufe sind I/O-bound: beide APIs einer Query laufen parallel, und die nächste
+        # Query wird gestartet, sobald die aktuelle eingesammelt ist (läuft also während
+        # Stepstone). So kostet der max_jobs-Stopp keine zusätzlichen API-Aufrufe. Der Limiter
+        # hält Aufrufe an dieselbe API so weit auseinander wie früher die Pause pro Query.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            def submit_query(query):
+                return (executor.submit(_API_RATE_LIMITER.call, 'adzuna', self.search_adzuna_api, query, jobs_per_source),
+                        executor.submit(_API_RATE_LIMITER.call, 'jsearch', self.search_jsearch_api, query, jobs_per_source))
+            
+            next_futures = submit_query(query_list[0]) if query_list and max_jobs > 0 else None
+            for i, query in enumerate(query_list):
+                if next_futures is None:
+                    break
+                adzuna_future, jsearch_future = next_futures
                 
-                # Fallback auf HTTP wenn Browser fehlschlägt
-                if len(stepstone_jobs) == 0:
-                    print("   🔄 Browser fehlgeschlagen - versuche HTTP-Fallback")
-                    stepstone_jobs = self.search_stepstone_http(query, jobs_per_source)
+                print(f"\n🎯 '{query}'")
                 
-                all_jobs.extend(stepstone_jobs)
-            else:
-                print("🔍 STEPSTONE: Übersprungen (--skip-stepstone)")
-            
-            print(f"📊 Query Total: {len(adzuna_jobs + jsearch_jobs + stepstone_jobs)} Jobs")
-            
-            time.sleep(2)  # Pause zwischen Queries
+                # 1. Adzuna API - Professionell
+                adzuna_jobs = adzuna_future.result()
+                add_jobs(adzuna_jobs)
+                
+                # 2. JSearch API - Schnell
+                jsearch_jobs = jsearch_future.result()
+                add_jobs(jsearch_jobs)
+                
+                next_futures = None
+                if i + 1 < len(query_list) and len(all_jobs) < max_jobs:
+                    next_futures = submit_query(query_list[i + 1])
+                
+                # 3. Stepstone - Premium deutsch (mit Fallback), Browser läuft nur im Hauptthread
+                stepstone_jobs = []
+                if not self.skip_stepstone:
+                    print("🔍 STEPSTONE: Browser zuerst, dann HTTP-Fallback")
+                    stepstone_jobs = self.search_stepstone_stealth(query, jobs_per_source)
+                    
+                    # Fallback auf HTTP wenn Browser fehlschlägt
+                    if len(stepstone_jobs) == 0:
+                        print("   🔄 Browser fehlgeschlagen - versuche HTTP-Fallback")
+                        stepstone_jobs = self.search_stepstone_http(query, jobs_per_source)
+                    
+                    add_jobs(stepstone_jobs)
+                else:
+                    print("🔍 STEPSTONE: Übersprungen (--skip-stepstone)")
+                
+                print(f"📊 Query Total: {len(adzuna_jobs + jsearch_jobs + stepstone_jobs)} Jobs")
+                
+                if len(all_jobs) >= max_jobs:
+                    # Hat erst Stepstone die Lücke gefüllt, läuft die nächste Query schon und
+                    # wird beim Verlassen des Pools noch abgewartet (höchstens ein API-Paar)
+                    break
         
         print(f"\n📊 GESAMT: {len(all_jobs)} Jobs")
         print(f"📈 PLATFORM-VERTEILUNG:")
@@ -638,6 +1366,14 @@ class UltimateJobHunter:
 
     def build_api_content(self, job):
         """🔧 Baue strukturierten Content aus ALLEN verfügbaren API-Daten"""
+        # Jobs are rebuilt on every re-process/rewrite; their API data doesn't change in a session
+        job_id = job.get('job_id')
+        cache_key = (job.get('platform'), job_id) if job_id else None
+        if cache_key is not None:
+            cached = self._api_content_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         content_parts = [
             f"Position: {job['title']}",
             f"Unternehmen: {job['company']}",
@@ -645,154 +1381,60 @@ class UltimateJobHunter:
             f"Plattform: {job['platform']}"
         ]
         
-        # ERWEITERTE Firmeninformationen (JSearch)
-        if job['platform'] == 'JSearch':
-            if job.get('employer_website'): 
-                content_parts.append(f"Firmen-Website: {job['employer_website']}")
-            if job.get('employer_company_type'): 
-                content_parts.append(f"Unternehmenstyp: {job['employer_company_type']}")
-            if job.get('job_publisher'): 
-                content_parts.append(f"Veröffentlicht über: {job['job_publisher']}")
-            
-            # DETAILLIERTE Gehaltsinformationen
-            salary_parts = []
-            if job.get('job_min_salary') and job.get('job_max_salary'):
-                currency = job.get('job_salary_currency', 'USD')
-                period = job.get('job_salary_period', 'year')
-                salary_parts.append(f"{job['job_min_salary']:,} - {job['job_max_salary']:,} {currency} per {period}")
-            elif job.get('job_salary'):
-                salary_parts.append(str(job['job_salary']))
-            
-            if salary_parts:
-                content_parts.append(f"Gehalt: {' / '.join(salary_parts)}")
-            
-            # Arbeitszeit und Remote-Optionen
-            if job.get('job_employment_type'): 
-                content_parts.append(f"Arbeitszeit: {job['job_employment_type']}")
-            if job.get('job_is_remote'): 
-                content_parts.append(f"Remote-Arbeit: {'Ja' if job['job_is_remote'] else 'Nein'}")
-            if job.get('job_posted_at'): 
-                content_parts.append(f"Veröffentlicht: {job['job_posted_at']}")
-        
-        # ERWEITERTE Adzuna-Daten
-        if job['platform'] == 'Adzuna':
-            # Gehaltsinformationen (mit Hinweis ob geschätzt)
-            if job.get('salary_min') or job.get('salary_max'):
-                salary_info = []
-                if job.get('salary_min'): salary_info.append(f"ab {job['salary_min']}€")
-                if job.get('salary_max'): salary_info.append(f"bis {job['salary_max']}€")
-                salary_text = ' '.join(salary_info)
-                if job.get('salary_is_predicted'):
-                    salary_text += " (geschätzt)"
-                content_parts.append(f"Gehalt: {salary_text}")
-            
-            # Vertragsart und Kategorie
-            if job.get('contract_type'): 
-                content_parts.append(f"Vertragsart: {job['contract_type']}")
-            if job.get('category_label'): 
-                content_parts.append(f"Kategorie: {job['category_label']}")
-            
-            # Zeitstempel und Job-ID
-            if job.get('created'): 
-                content_parts.append(f"Veröffentlicht: {job['created']}")
-            if job.get('job_id'): 
-                content_parts.append(f"Job-ID: {job['job_id']}")
-            
-            # Geografische Details
-            if job.get('latitude') and job.get('longitude'):
-                content_parts.append(f"Koordinaten: {job['latitude']:.4f}, {job['longitude']:.4f}")
-            
-            # Erweiterte Firmendaten
-            company_data = job.get('company_data', {})
-            if isinstance(company_data, dict) and len(company_data) > 1:
-                # Falls Adzuna mehr Firmendaten hat als nur display_name
-                company_details = []
-                for key, value in company_data.items():
-                    if key != 'display_name' and key != '__CLASS__' and value:
-                        company_details.append(f"{key}: {value}")
-                if company_details:
-                    content_parts.append(f"Firmendetails: {', '.join(company_details)}")
+        platform = job['platform']
+        fields = _API_CONTENT_FIELDS.get(platform, ())
+        details = _API_CONTENT_DETAIL_FIELDS.get(platform, ())
+        for prefix, key, fmt in fields:
+            _append_api_field(content_parts, job, prefix, key, fmt)
         
         # Hauptbeschreibung
         if job.get('description'):
             content_parts.append(f"\nStellenbeschreibung:\n{job['description']}")
         
-        # ERWEITERTE JSearch-Zusatzdaten
-        if job['platform'] == 'JSearch':
-            # VOLLSTÄNDIGE Benefits-Liste (nicht nur 3!)
-            if job.get('job_benefits'):
-                benefits_data = job['job_benefits']
-                if isinstance(benefits_data, list):
-                    # Liste von Benefits
-                    benefits_text = '\n'.join([f"• {benefit}" for benefit in benefits_data])
-                    content_parts.append(f"\nBenefits und Zusatzleistungen:\n{benefits_text}")
-                else:
-                    # String oder andere Datentyp
-                    content_parts.append(f"\nBenefits und Zusatzleistungen:\n{benefits_data}")
-            
-            # Qualifikationen und Anforderungen
-            if job.get('job_qualifications'):
-                content_parts.append(f"\nAnforderungen und Qualifikationen:\n{job['job_qualifications']}")
-            
-            # NEUE FELDER - Erfahrungsanforderungen
-            if job.get('job_required_experience'):
-                exp_data = job['job_required_experience']
-                if isinstance(exp_data, dict):
-                    exp_text = ', '.join([f"{k}: {v}" for k, v in exp_data.items() if v])
-                    content_parts.append(f"\nErfahrungsanforderungen:\n{exp_text}")
-                else:
-                    content_parts.append(f"\nErfahrungsanforderungen:\n{exp_data}")
-            
-            # NEUE FELDER - Erforderliche Skills
-            if job.get('job_required_skills'):
-                skills_data = job['job_required_skills']
-                if isinstance(skills_data, list):
-                    skills_text = ', '.join(skills_data)
-                    content_parts.append(f"\nErforderliche Skills:\n{skills_text}")
-                else:
-                    content_parts.append(f"\nErforderliche Skills:\n{skills_data}")
-            
-            # NEUE FELDER - Bildungsanforderungen
-            if job.get('job_required_education'):
-                edu_data = job['job_required_education']
-                if isinstance(edu_data, dict):
-                    edu_text = ', '.join([f"{k}: {v}" for k, v in edu_data.items() if v])
-                    content_parts.append(f"\nBildungsanforderungen:\n{edu_text}")
-                else:
-                    content_parts.append(f"\nBildungsanforderungen:\n{edu_data}")
-            
-            # Job-Highlights (oft sehr detailliert!)
-            if job.get('job_highlights'):
-                highlights_data = job['job_highlights']
-                if isinstance(highlights_data, dict):
-                    for section, items in highlights_data.items():
-                        if items:
-                            if isinstance(items, list):
-                                items_text = '\n'.join([f"• {item}" for item in items])
-                                content_parts.append(f"\n{section.title()}:\n{items_text}")
-                            else:
-                                content_parts.append(f"\n{section.title()}:\n{items}")
-        
-        return '\n'.join(content_parts)
+        for prefix, key, fmt in details:
+            _append_api_field(content_parts, job, prefix, key, fmt)
+        
+        content = '\n'.join(content_parts)
+        if cache_key is not None:
+            self._api_content_cache[cache_key] = content
+        return content
 
     def scrape_with_strategy(self, url):
         """🔍 Verbesserte Scraping-Strategie für vollständige Stellenbeschreibungen"""
+        content = self._scrape_cache.get(url)
+        if content is not None:
+            print(f"   ♻️ Cache: {url[:60]}")
+            return content
+        
+        content = self._scrape_page(url)
+        if content:
+            self._scrape_cache.set(url, content)
+        return content
+
+    def _scrape_page(self, url):
+        """Fetch and parse one job page (uncached, see scrape_with_strategy)"""
         try:
             print(f"   📄 Scraping: {url[:60]}...")
             
-            # User-Agent für bessere Akzeptanz
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = self.session.get(url, timeout=self.config.get('job_search.timeouts.job_hunter_ultimate_request', 20), headers=headers)
+            response = self.session.get(url, timeout=self.config.get('job_search.timeouts.job_hunter_ultimate_request', 20), headers=_SCRAPE_HEADERS, stream=True)
+            try:
+                # Nur den Anfang der Seite laden - der Text wird ohnehin auf 4000 Zeichen gekürzt
+                chunks = []
+                total = 0
+                if response.status_code == 200:
+                    for chunk in response.iter_content(16384):
+                        chunks.append(chunk)
+                        total += len(chunk)
+                        if total >= _SCRAPE_MAX_BYTES:
+                            break
+            finally:
+                response.close()
             
             if response.status_code == 200:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(b''.join(chunks), 'lxml')
                 
                 # Entferne störende Elemente
-                for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
+                for tag in soup.find_all(_PAGE_NOISE_TAGS):
                     tag.decompose()
                 
                 # Spezielle Selektoren für Job-Seiten
@@ -804,14 +1446,8 @@ class UltimateJobHunter:
                 
                 # Allgemeine Job-Selektoren
                 if not job_content:
-                    selectors = [
-                        '.job-description', '.job-content', '.jobad-content',
-                        '[data-testid="job-description"]', '.description',
-                        'main', 'article', '.content'
-                    ]
-                    
-                    for selector in selectors:
-                        job_content = soup.select_one(selector)
+                    for selector in _JOB_CONTENT_SELECTORS:
+                        job_content = selector.select_one(soup)
                         if job_content and len(job_content.get_text().strip()) > 200:
                             break
                 
@@ -819,18 +1455,14 @@ class UltimateJobHunter:
                     # Extrahiere strukturierten Text
                     text = job_content.get_text(separator='\n', strip=True)
                     
-                    # Bereinige und strukturiere
-                    lines = [line.strip() for line in text.split('\n') if line.strip()]
-                    content = '\n'.join(lines)
-                    
-                    # Begrenzte aber substantielle Länge
-                    return content[:4000] if content else None
+                    # Bereinige und strukturiere - begrenzte aber substantielle Länge
+                    content = _join_clean_lines(text, '\n', 4000)
+                    return content or None
                 else:
                     # Fallback: Ganzer Seitentext
                     text = soup.get_text(separator=' ', strip=True)
-                    lines = [line.strip() for line in text.split('\n') if line.strip()]
-                    content = ' '.join(lines)
-                    return content[:3000] if content else None
+                    content = _join_clean_lines(text, ' ', 3000)
+                    return content or None
                     
             else:
                 print(f"   ❌ HTTP {response.status_code}")
@@ -840,6 +1472,29 @@ class UltimateJobHunter:
             print(f"   ❌ Scraping-Fehler: {e}")
             return None
 
+    @staticmethod
+    def _is_truncated_description(api_desc):
+        """API-Beschreibungen mit Auslassungszeichen oder unter 500 Zeichen gelten als abgeschnitten"""
+        return api_desc.endswith('…') or api_desc.endswith('...') or len(api_desc) < 500
+
+    def _needs_scrape(self, job):
+        """Same decision as in process_top_jobs: does this job go through scrape_with_strategy?"""
+        url = job.get('url')
+        if not url:
+            return False
+        if job.get('platform') in ['Adzuna', 'JSearch'] and job.get('description'):
+            # ADZUNA: Kein Scraping wegen Anti-Bot-Schutz (HTTP 403)
+            return self._is_truncated_description(job['description']) and job['platform'] != 'Adzuna'
+        return 'stepstone.de' not in url
+
+    def _prefetch_scrapes(self, jobs, max_workers=8):
+        """Scrape every page the given jobs need in parallel; returns {url: content or None}"""
+        urls = list(dict.fromkeys(job['url'] for job in jobs if self._needs_scrape(job)))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self.scrape_with_strategy, urls)))
+
     def process_top_jobs(self, ranked_jobs, count=3):
         """🚀 Verarbeite Top-Jobs (CLI-Modus) - jetzt mit Rückfrage-Logik und robusteren Dateinamen"""
         if not ranked_jobs:
@@ -849,134 +1504,190 @@ class UltimateJobHunter:
         print(f"\n🚀 Verarbeite TOP {count} Jobs:")
         
         successful = 0
+        batch_now_iso = datetime.now().isoformat()  # ein Zeitstempel für alle Jobs dieses Laufs
+        
+        top_jobs = ranked_jobs[:count]
+        # Alle benötigten Seiten parallel laden statt nacheinander im Loop
+        scraped_pages = self._prefetch_scrapes(top_jobs)
+        
+        # Content, Anschreiben und Adresssuche laufen parallel; Rückfrage und Speichern
+        # danach der Reihe nach in Ranking-Reihenfolge (input() braucht den Haupt-Thread)
+        with ThreadPoolExecutor(max_workers=max(1, min(len(top_jobs), 4))) as executor:
+            prepared_jobs = [prepared for prepared in executor.map(
+                lambda numbered: self._prepare_top_job(numbered[1], numbered[0], scraped_pages),
+                enumerate(top_jobs, 1)
+            ) if prepared]
+        
+        # 💬 Eine gemeinsame Rückfrage für alle Jobs ohne Firmenanschrift
+        skipped = self._confirm_jobs_without_address(
+            [prepared for prepared in prepared_jobs if not prepared['address_present']]
+        )
         
-        for i, job in enumerate(ranked_jobs[:count], 1):
-            print(f"\n📝 Job {i}: {job['title']} @ {job['company']}")
-            print(f"🔗 {job['url']}")
-            
-            # Für Dateinamen & Pfade
-            from pathlib import Path
-            from job_utils import clean_filename_string
-            
-            # 🔑 Stelle sicher, dass wir eine job_id besitzen (Ranking entfernt es manchmal)
-            job_id_candidate = job.get('job_id') or job.get('id')
-            if job_id_candidate:
-                job['job_id'] = str(job_id_candidate)  # Ensure it's a string
-            else:
-                # Generiere Fallback-ID
-                import uuid
-                job['job_id'] = str(uuid.uuid4())
+        applications_dir = Path("applications")
+        applications_dir.mkdir(parents=True, exist_ok=True)
+        # Drafts aller Jobs in einer Transaktion statt einem Commit pro Job
+        pdf_tasks = []
+        with draft_batch():
+            for prepared in prepared_jobs:
+                if prepared['index'] in skipped:
+                    print(f"⏭️  Job {prepared['index']} übersprungen - keine Datei gespeichert.")
+                    continue
+                if self._save_top_job(prepared, batch_now_iso, applications_dir, pdf_tasks):
+                    successful += 1
+        
+        # PDFs zum Schluss gemeinsam rendern (parallel ab zwei PDFs)
+        if pdf_tasks:
+            print(f"📄 Erstelle {len(pdf_tasks)} PDF(s)...")
+            for task, ok in zip(pdf_tasks, self._render_pdfs(pdf_tasks)):
+                print(("✅ PDF: " if ok else "❌ PDF fehlgeschlagen: ") + os.path.basename(task[1]))
+        
+        print(f"\n🎉 {successful} Bewerbungen verarbeitet!")
+
+    def _confirm_jobs_without_address(self, missing):
+        """Fragt einmal für alle vorbereiteten Jobs ohne Anschrift nach; gibt die zu überspringenden Job-Nummern zurück"""
+        if not missing:
+            return set()
+        
+        if not sys.stdin.isatty():
+            # Non-interactive mode - automatically save
+            print(f"⚠️  Keine Firmenanschrift für {len(missing)} Job(s) gefunden. Speichere trotzdem (non-interactive mode).")
+            return set()
+        
+        print("\n⚠️  Keine Firmenanschrift gefunden für:")
+        for prepared in missing:
+            print(f"   {prepared['index']}. {prepared['job']['title']} @ {prepared['company_name']}")
+        try:
+            answer = input("Trotzdem TXT-Dateien speichern? (j = alle, n = keine, oder Nummern z.B. 1,3): ").strip().lower()
+        except EOFError:
+            print("⚠️  Keine Eingabe möglich. Speichere trotzdem (non-interactive mode).")
+            return set()
+        
+        missing_indices = {prepared['index'] for prepared in missing}
+        if answer.startswith('j'):
+            return set()
+        chosen = {int(number) for number in re.findall(r'\d+', answer)}
+        return missing_indices - chosen
+
+    def _prepare_top_job(self, job, i, scraped_pages):
+        """process_top_jobs, parallel part: Content, Anschreiben und Adresse für einen Job
+
+        Gibt die Daten für _save_top_job zurück, oder None wenn der Job übersprungen wird.
+        """
+        print(f"\n📝 Job {i}: {job['title']} @ {job['company']}")
+        print(f"🔗 {job['url']}")
+        
+        # 🔑 Stelle sicher, dass wir eine job_id besitzen (Ranking entfernt es manchmal)
+        job_id_candidate = job.get('job_id') or job.get('id')
+        if job_id_candidate:
+            job['job_id'] = str(job_id_candidate)  # Ensure it's a string
+        else:
+            # Generiere Fallback-ID
+            job['job_id'] = str(uuid.uuid4())
+        
+        try:
+            # Nutze API-Daten direkt oder Scraping als Fallback
+            content = None
             
-            try:
-                # Nutze API-Daten direkt oder Scraping als Fallback
-                content = None
+            if job['platform'] in ['Adzuna', 'JSearch'] and job.get('description'):
+                # ZUERST: Versuche vollständige Beschreibung durch Scraping zu bekommen
+                print("📊 API-Daten verfügbar - versuche vollständige Beschreibung...")
                 
-                if job['platform'] in ['Adzuna', 'JSearch'] and job.get('description'):
-                    # ZUERST: Versuche vollständige Beschreibung durch Scraping zu bekommen
-                    print("📊 API-Daten verfügbar - versuche vollständige Beschreibung...")
-                    
-                    # Prüfe ob API-Beschreibung vollständig ist (nicht abgeschnitten)
-                    api_desc = job.get('description', '')
-                    is_truncated = api_desc.endswith('…') or api_desc.endswith('...') or len(api_desc) < 500
+                # Prüfe ob API-Beschreibung vollständig ist (nicht abgeschnitten)
+                api_desc = job.get('description', '')
+                is_truncated = self._is_truncated_description(api_desc)
+                
+                # ADZUNA: Kein Scraping wegen Anti-Bot-Schutz (HTTP 403)
+                if is_truncated and job.get('url') and job['platform'] != 'Adzuna':
+                    print(f"📄 API-Beschreibung abgeschnitten ({len(api_desc)} Zeichen) - scrape vollständige Version...")
+                    scraped_content = scraped_pages.get(job['url'])
                     
-                    # ADZUNA: Kein Scraping wegen Anti-Bot-Schutz (HTTP 403)
-                    if is_truncated and job.get('url') and job['platform'] != 'Adzuna':
-                        print(f"📄 API-Beschreibung abgeschnitten ({len(api_desc)} Zeichen) - scrape vollständige Version...")
-                        scraped_content = self.scrape_with_strategy(job['url'])
-                        
-                        if scraped_content and len(scraped_content) > len(api_desc):
-                            print(f"✅ Vollständige Beschreibung gescrapt: {len(scraped_content)} Zeichen")
-                            content = scraped_content
-                        else:
-                            print("⚠️ Scraping fehlgeschlagen - nutze API-Daten")
-                            content = self.build_api_content(job)
-                    elif job['platform'] == 'Adzuna' and is_truncated:
-                        print(f"📊 Adzuna-Beschreibung kurz ({len(api_desc)} Zeichen) - aber kein Scraping (Anti-Bot-Schutz)")
-                        content = self.build_api_content(job)
+                    if scraped_content and len(scraped_content) > len(api_desc):
+                        print(f"✅ Vollständige Beschreibung gescrapt: {len(scraped_content)} Zeichen")
+                        content = scraped_content
                     else:
-                        print("📊 API-Beschreibung scheint vollständig zu sein")
+                        print("⚠️ Scraping fehlgeschlagen - nutze API-Daten")
                         content = self.build_api_content(job)
-                    
-                elif 'stepstone.de' in job['url']:
-                    # Nur Stepstone muss gescrapt werden
-                    print("📄 Scrape Stepstone...")
-                    content = self.bewerbungshelfer.scrape_stepstone_with_retry(job['url'])
-                    
-                    if not content or len(content) < 200:
-                        print(f"❌ Stepstone Scraping fehlgeschlagen ({len(content) if content else 0} Zeichen)")
-                        content = None
+                elif job['platform'] == 'Adzuna' and is_truncated:
+                    print(f"📊 Adzuna-Beschreibung kurz ({len(api_desc)} Zeichen) - aber kein Scraping (Anti-Bot-Schutz)")
+                    content = self.build_api_content(job)
                 else:
-                    # Andere URLs - versuche Scraping
-                    print("📄 Scrape Content...")
-                    content = self.scrape_with_strategy(job['url'])
+                    print("📊 API-Beschreibung scheint vollständig zu sein")
+                    content = self.build_api_content(job)
                 
-                # Fallback für alle fehlgeschlagenen Fälle
-                if not content or len(content) < 200:
-                    print(f"🆘 Fallback: Nutze Job-Basis-Infos...")
-                    content = f"""
-                    Stellenausschreibung:
-                    Position: {job['title']}
-                    Unternehmen: {job['company']}
-                    Standort: {job['location']}
-                    
-                    Eine interessante Position im Bereich Digital Marketing und E-Commerce.
-                    Weitere Details zur Position werden gerne im persönlichen Gespräch besprochen.
-                    """
-                
-                print(f"✅ Content: {len(content)} Zeichen")
-                
-                # Anschreiben generieren
-                print("⚡ Generiere Anschreiben...")
-                # 🔧 KRITISCHER FIX: Korrekte job_data Übergabe für Betreff-Extraktion
-                manual_job_data = {
-                    'title': job.get('title'),
-                    'company': job.get('company'),
-                    'location': job.get('location'),
-                    'url': job.get('url')
-                }
+            elif 'stepstone.de' in job['url']:
+                # Nur Stepstone muss gescrapt werden
+                print("📄 Scrape Stepstone...")
+                content = self.bewerbungshelfer.scrape_stepstone_with_retry(job['url'])
                 
-                # Verwende neuen modularen ApplicationGenerator (Fassade)
-                if hasattr(self.bewerbungshelfer, "application_generator"):
-                    anschreiben = self.bewerbungshelfer.application_generator.generate_letter(content, job_data=manual_job_data)
-                else:
-                    anschreiben = self.bewerbungshelfer.generate_anschreiben(content, job_data=manual_job_data)
-                
-                if not anschreiben:
-                    print("❌ Anschreiben-Fehler")
-                    continue
-                
-                # PDF erstellen mit positionsbasiertem Namen
-                print("📄 Erstelle PDF...")
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                
-                # Positionsbasierter Dateiname (wird später noch gefiltert)
-                raw_title = job.get('title') or job.get('position') or 'Bewerbung'
-                position_clean = clean_job_title_string(raw_title) if raw_title else 'Bewerbung'
-                pdf_file = f"Bewerbung als {position_clean}_{timestamp}.pdf"
-                txt_file = f"Bewerbung als {position_clean}_{timestamp}.txt"
-                
-                # Vollständiges DIN 5008 Format erstellen
-                full_letter = self.bewerbungshelfer.create_full_din5008_letter(anschreiben, content, job)
-                
-                # WICHTIGE INFOS OBEN + Stellenausschreibung für Abgleich
-                # datetime ist bereits oben importiert
-                
-                # Extrahiere wichtige Job-Infos
-                job_date = job.get('created') or job.get('job_posted_at') or job.get('date_found', 'Unbekannt')
-                employment_type = job.get('job_employment_type') or job.get('contract_type', 'Nicht angegeben')
-                is_remote = job.get('job_is_remote', False)
-                remote_info = "Remote" if is_remote else "Vor Ort"
-                
-                # Versuche Remote-Info aus Beschreibung zu extrahieren falls nicht in API
-                if not is_remote and content:
-                    content_lower = content.lower()
-                    if any(term in content_lower for term in ['remote', 'homeoffice', 'home office', 'hybrid']):
-                        if 'hybrid' in content_lower:
-                            remote_info = "Hybrid"
-                        elif any(term in content_lower for term in ['remote', 'homeoffice', 'home office']):
-                            remote_info = "Remote möglich"
-                
-                reference_info = f"""=== 📋 JOB-ÜBERSICHT ===
+                if not content or len(content) < 200:
+                    print(f"❌ Stepstone Scraping fehlgeschlagen ({len(content) if content else 0} Zeichen)")
+                    content = None
+            else:
+                # Andere URLs - versuche Scraping
+                print("📄 Scrape Content...")
+                content = scraped_pages.get(job['url'])
+            
+            # Fallback für alle fehlgeschlagenen Fälle
+            if not content or len(content) < 200:
+                print(f"🆘 Fallback: Nutze Job-Basis-Infos...")
+                content = f"""
+                Stellenausschreibung:
+                Position: {job['title']}
+                Unternehmen: {job['company']}
+                Standort: {job['location']}
+                
+                Eine interessante Position im Bereich Digital Marketing und E-Commerce.
+                Weitere Details zur Position werden gerne im persönlichen Gespräch besprochen.
+                """
+            
+            print(f"✅ Content: {len(content)} Zeichen")
+            
+            # Anschreiben generieren
+            print("⚡ Generiere Anschreiben...")
+            # 🔧 KRITISCHER FIX: Korrekte job_data Übergabe für Betreff-Extraktion
+            manual_job_data = {
+                'title': job.get('title'),
+                'company': job.get('company'),
+                'location': job.get('location'),
+                'url': job.get('url')
+            }
+            
+            # Verwende neuen modularen ApplicationGenerator (Fassade)
+            if hasattr(self.bewerbungshelfer, "application_generator"):
+                anschreiben = self.bewerbungshelfer.application_generator.generate_letter(content, job_data=manual_job_data)
+            else:
+                anschreiben = self.bewerbungshelfer.generate_anschreiben(content, job_data=manual_job_data)
+            
+            if not anschreiben:
+                print("❌ Anschreiben-Fehler")
+                return None
+            
+            # Positionsbasierter, dateisystem-sicherer Dateiname
+            raw_title = job.get('title') or job.get('position') or 'Bewerbung'
+            safe_title = clean_filename_string(clean_job_title_string(raw_title))
+            
+            # Vollständiges DIN 5008 Format erstellen
+            full_letter = self.bewerbungshelfer.create_full_din5008_letter(anschreiben, content, job)
+            
+            # WICHTIGE INFOS OBEN + Stellenausschreibung für Abgleich
+            # datetime ist bereits oben importiert
+            
+            # Extrahiere wichtige Job-Infos
+            job_date = job.get('created') or job.get('job_posted_at') or job.get('date_found', 'Unbekannt')
+            employment_type = job.get('job_employment_type') or job.get('contract_type', 'Nicht angegeben')
+            is_remote = job.get('job_is_remote', False)
+            remote_info = "Remote" if is_remote else "Vor Ort"
+            
+            # Versuche Remote-Info aus Beschreibung zu extrahieren falls nicht in API
+            if not is_remote and content:
+                # Ein Durchlauf ohne lower()-Kopie; "hybrid" hat Vorrang vor remote/homeoffice
+                terms = {m.group().lower() for m in _REMOTE_TERMS_RE.finditer(content)}
+                if 'hybrid' in terms:
+                    remote_info = "Hybrid"
+                elif terms:
+                    remote_info = "Remote möglich"
+            
+            reference_info = f"""=== 📋 JOB-ÜBERSICHT ===
 🎯 POSITION: {job['title']}
 🏢 UNTERNEHMEN: {job['company']}
 📍 ORT: {job['location']}
@@ -993,86 +1704,112 @@ class UltimateJobHunter:
 
 === 📋 ENDE STELLENAUSSCHREIBUNG ===
 """
-                
-                full_letter_with_reference = full_letter + "\n\n" + reference_info
-                
-                # ────────────────────────────────────────────────
-                # 📄 DATEIEN SPEICHERN (mit sicherem Dateinamen)
-                # ────────────────────────────────────────────────
-                safe_title = clean_filename_string(position_clean)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                folder_path = Path("applications")
-                folder_path.mkdir(parents=True, exist_ok=True)
-                base_name = folder_path / f"Bewerbung_{safe_title}_{timestamp}"
-                txt_file_path = base_name.with_suffix('.txt')
-                pdf_file_path = base_name.with_suffix('.pdf')
-                
-                # 📍 Firmenadresse suchen (nachdem Anschreiben fertig ist)
-                company_name = job.get('company', 'Unbekanntes Unternehmen')
-                if hasattr(self.bewerbungshelfer, "address_lookup"):
-                    address_info = self.bewerbungshelfer.address_lookup.find_address(
-                        company_name,
-                        job_description=content or "",
-                        job_data=job,
-                    )
-                else:
-                    address_info = self.bewerbungshelfer.find_company_address(company_name, content or "", job_data=job)
-                
-                address_present = self.bewerbungshelfer.should_create_pdf_with_address(address_info)
-                
-                # 💬 Neue Rückfrage-Logik, falls keine Adresse vorhanden
-                if not address_present:
-                    try:
-                        answer = input("⚠️  Keine Firmenanschrift gefunden. Trotzdem TXT-Datei speichern (j/n)? ")
-                        if not answer.lower().startswith('j'):
-                            print("⏭️  Job übersprungen - keine Datei gespeichert.")
-                            continue  # Überspringe Job ohne etwas abzulegen
-                    except EOFError:
-                        # Non-interactive mode - automatically save
-                        print("⚠️  Keine Firmenanschrift gefunden. Speichere trotzdem (non-interactive mode).")
-                        pass
-                
-                # Schreibe TXT (immer, wenn wir hier sind)
-                with open(txt_file_path, 'w', encoding='utf-8') as f:
-                    f.write(full_letter_with_reference)
-                
-                # PDF nur, wenn Adresse vorhanden
-                pdf_path_str = None
-                if address_present:
-                    pdf_job_data = job.copy()
-                    if address_info:
-                        pdf_job_data['address_info'] = address_info
-                    ok = self.bewerbungshelfer.create_professional_pdf(
-                        anschreiben,
-                        str(pdf_file_path),
-                        job.get('description'),
-                        pdf_job_data
-                    )
-                    if ok:
-                        pdf_path_str = str(pdf_file_path)
-                
-                # Save to draft database for future editing
-                try:
-                    from draft_storage import create_draft
-                    job_info = {'company': company_name, 'title': job.get('title', 'Unbekannte Position')}
-                    create_draft(job_info, anschreiben)
-                    print(f"✅ Draft saved for {company_name} - {job.get('title', 'Unbekannte Position')}")
-                except Exception as draft_err:
-                    print(f"⚠️ Draft saving failed: {draft_err}")
-
-                # Job als abgeschlossen markieren
-                if self.mark_job_as_completed(job['job_id'], user_approved=True, job_data=job):
-                    successful += 1
-                    print("✅ Erfolgreich gespeichert! →", txt_file_path.name, ("+ PDF" if pdf_path_str else ""))
-                else:
-                    print("❌ Job completion failed")
-            except Exception as e:
-                print(f"❌ Fehler: {e}")
-                print("FULL TRACEBACK:")
-                import traceback
-                traceback.print_exc()
+            
+            # 📍 Firmenadresse suchen (nachdem Anschreiben fertig ist)
+            company_name = job.get('company', 'Unbekanntes Unternehmen')
+            if hasattr(self.bewerbungshelfer, "address_lookup"):
+                address_info = self.bewerbungshelfer.address_lookup.find_address(
+                    company_name,
+                    job_description=content or "",
+                    job_data=job,
+                )
+            else:
+                address_info = self.bewerbungshelfer.find_company_address(company_name, content or "", job_data=job)
+            
+            return {
+                'job': job,
+                'index': i,
+                'anschreiben': anschreiben,
+                'safe_title': safe_title,
+                'full_letter_with_reference': full_letter + "\n\n" + reference_info,
+                'company_name': company_name,
+                'address_info': address_info,
+                'address_present': self.bewerbungshelfer.should_create_pdf_with_address(address_info),
+            }
+        except Exception as e:
+            print(f"❌ Fehler: {e}")
+            print("FULL TRACEBACK:")
+            traceback.print_exc()
+            return None
+
+    def _render_pdfs(self, tasks):
+        """Render (anschreiben, pdf_path, description, job_data) tasks, preserving order"""
+        if len(tasks) >= 2:
+            pool = _get_pdf_pool()
+            try:
+                return list(pool.map(_render_pdf_worker, *zip(*tasks), chunksize=1))
+            except BrokenProcessPool as e:
+                print(f"⚠️ PDF-Worker ausgefallen ({e}) - rendere im Hauptprozess")
+                _discard_pdf_pool(pool)
+        # Single PDFs skip process start-up and pickling; also the fallback for a broken pool
+        return [self._render_pdf_in_process(task) for task in tasks]
+
+    def _render_pdf_in_process(self, task):
+        try:
+            return self.bewerbungshelfer.create_professional_pdf(*task)
+        except Exception as e:
+            print(f"❌ PDF-Fehler ({os.path.basename(task[1])}): {e}")
+            return False
+
+    def _save_top_job(self, prepared, batch_now_iso, applications_dir, pdf_tasks):
+        """process_top_jobs, sequential part: Dateien, Draft und Completion für einen Job
+
+        Das PDF wird nur als Task an pdf_tasks angehängt und danach von _render_pdfs erstellt.
+        """
+        job = prepared['job']
+        anschreiben = prepared['anschreiben']
+        company_name = prepared['company_name']
+        address_info = prepared['address_info']
         
-        print(f"\n🎉 {successful} Bewerbungen verarbeitet!")
+        try:
+            # ────────────────────────────────────────────────
+            # 📄 DATEIEN SPEICHERN (mit sicherem Dateinamen)
+            # ────────────────────────────────────────────────
+            safe_title = prepared['safe_title']
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            folder_path = applications_dir
+            base_name = folder_path / f"Bewerbung_{safe_title}_{timestamp}"
+            if base_name.with_suffix('.txt').exists():
+                # Gleiche Position in derselben Sekunde (parallel vorbereitete Jobs)
+                base_name = folder_path / f"Bewerbung_{safe_title}_{timestamp}_{prepared['index']}"
+            txt_file_path = base_name.with_suffix('.txt')
+            pdf_file_path = base_name.with_suffix('.pdf')
+            
+            address_present = prepared['address_present']
+            
+            # Schreibe TXT (immer, wenn wir hier sind - Rückfrage siehe _confirm_jobs_without_address)
+            with open(txt_file_path, 'w', encoding='utf-8') as f:
+                f.write(prepared['full_letter_with_reference'])
+            
+            # PDF nur, wenn Adresse vorhanden
+            pdf_path_str = None
+            if address_present:
+                pdf_job_data = job.copy()
+                if address_info:
+                    pdf_job_data['address_info'] = address_info
+                pdf_path_str = str(pdf_file_path)
+                pdf_tasks.append((anschreiben, pdf_path_str, job.get('description'), pdf_job_data))
+            
+            # Save to draft database for future editing
+            try:
+                from draft_storage import create_draft
+                job_info = {'company': company_name, 'title': job.get('title', 'Unbekannte Position')}
+                create_draft(job_info, anschreiben)
+                print(f"✅ Draft saved for {company_name} - {job.get('title', 'Unbekannte Position')}")
+            except Exception as draft_err:
+                print(f"⚠️ Draft saving failed: {draft_err}")
+
+            # Job als abgeschlossen markieren
+            if self.mark_job_as_completed(job['job_id'], user_approved=True, job_data=job, now_iso=batch_now_iso):
+                print("✅ Erfolgreich gespeichert! →", txt_file_path.name, ("+ PDF" if pdf_path_str else ""))
+                return True
+            print("❌ Job completion failed")
+            return False
+        except Exception as e:
+            print(f"❌ Fehler: {e}")
+            print("FULL TRACEBACK:")
+            traceback.print_exc()
+            return False
 
     def hunt_ultimate(self, max_jobs=15, auto_process=3, keywords=None):
         """🎯 Ultimate Job Hunt"""
@@ -1117,11 +1854,16 @@ class UltimateJobHunter:
             print("\n⏹️ Unterbrochen")
         except Exception as e:
             print(f"\n❌ Fehler: {e}")
-            import traceback
             traceback.print_exc()
 
     def scrape_stepstone_job_details(self, driver, job_url):
         """🔍 Scrape einzelne Stepstone-Job-Details für bessere Anschreiben"""
+        cache_key = f"stepstone-details:{job_url}"
+        cached = self._scrape_cache.get(cache_key)
+        if cached is not None:
+            print(f"      ♻️ Details aus Cache: {job_url[:50]}")
+            return cached
+        
         details = {'description': '', 'requirements': '', 'benefits': ''}
         
         try:
@@ -1147,27 +1889,16 @@ class UltimateJobHunter:
                 pass  # Fallback: Versuche trotzdem zu parsen
             
             # BeautifulSoup für robustes Parsing
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Verschiedene Selektoren für Job-Beschreibung
-            description_selectors = [
-                '[data-testid="job-description"]',
-                '.job-description',
-                '#job-description',
-                '.jobad-content',
-                '.job-content',
-                'main section',
-                'article'
-            ]
+            soup = BeautifulSoup(driver.page_source, 'lxml')
             
+            # Verschiedene Selektoren für Job-Beschreibung (_STEPSTONE_DESCRIPTION_SELECTORS)
             description_text = ""
-            for selector in description_selectors:
-                elements = soup.select(selector)
+            for selector in _STEPSTONE_DESCRIPTION_SELECTORS:
+                elements = selector.select(soup)
                 if elements:
                     for elem in elements:
                         # Skripte und Styles entfernen
-                        for tag in elem(['script', 'style', 'nav', 'header', 'footer']):
+                        for tag in elem.find_all(_SECTION_NOISE_TAGS):
                             tag.decompose()
                         text = elem.get_text(' ', strip=True)
                         if len(text) > 100:  # Nur substantielle Texte
@@ -1178,7 +1909,7 @@ class UltimateJobHunter:
             # Fallback: Gesamter Seitentext
             if not description_text:
                 # Alle störenden Elemente entfernen
-                for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+                for tag in soup.find_all(_STEPSTONE_NOISE_TAGS):
                     tag.decompose()
                 description_text = soup.get_text(' ', strip=True)
             
@@ -1189,27 +1920,23 @@ class UltimateJobHunter:
             text_lower = description_text.lower()
             
             # Anforderungen extrahieren
-            requirements_keywords = ['anforderungen', 'requirements', 'qualifikation', 'erfahrung', 'skills', 'kenntnisse']
+            # Alle Schlüsselwörter in einem Durchlauf finden
+            keyword_positions = _first_keyword_positions(text_lower)
             requirements = []
-            for keyword in requirements_keywords:
-                if keyword in text_lower:
+            for keyword in _REQUIREMENTS_KEYWORDS:
+                if keyword in keyword_positions:
                     # Vereinfachte Extraktion
-                    start = text_lower.find(keyword)
-                    if start != -1:
-                        segment = description_text[start:start+500]
-                        requirements.append(segment)
-                        break
+                    start = keyword_positions[keyword]
+                    requirements.append(description_text[start:start+500])
+                    break
             
             # Benefits extrahieren
-            benefits_keywords = ['benefits', 'vorteile', 'bieten wir', 'unser angebot', 'was wir bieten']
             benefits = []
-            for keyword in benefits_keywords:
-                if keyword in text_lower:
-                    start = text_lower.find(keyword)
-                    if start != -1:
-                        segment = description_text[start:start+300]
-                        benefits.append(segment)
-                        break
+            for keyword in _BENEFITS_KEYWORDS:
+                if keyword in keyword_positions:
+                    start = keyword_positions[keyword]
+                    benefits.append(description_text[start:start+300])
+                    break
             
             details = {
                 'description': description_text,
@@ -1218,6 +1945,8 @@ class UltimateJobHunter:
             }
             
             print(f"      ✅ Details: {len(description_text)} chars")
+            if description_text:
+                self._scrape_cache.set(cache_key, details)
             
         except Exception as detail_error:
             print(f"      ⚠️ Detail-Scraping fehlgeschlagen: {detail_error}")
@@ -1237,18 +1966,19 @@ class UltimateJobHunter:
     def hunt_interactive(self, keyword_str='', max_jobs=15, max_age_days=None, location=None, include_remote=False, profile_name=None):
         """🎯 Neue Interactive Hunt-Funktion"""
         try:
-            self.emit_json_event('stage_change', {
-                'stage': 'Initialisierung',
-                'message': 'Starte Interactive Job Search...',
-                'progress': 0
-            })
-            
-            # Schritt 1: Jobs sammeln
-            self.emit_json_event('stage_change', {
-                'stage': 'Jobsuche',
-                'message': 'Sammle Jobs von verschiedenen Plattformen...',
-                'progress': 10
-            })
+            with self.batched_json_events():
+                self.emit_json_event('stage_change', {
+                    'stage': 'Initialisierung',
+                    'message': 'Starte Interactive Job Search...',
+                    'progress': 0
+                })
+                
+                # Schritt 1: Jobs sammeln
+                self.emit_json_event('stage_change', {
+                    'stage': 'Jobsuche',
+                    'message': 'Sammle Jobs von verschiedenen Plattformen...',
+                    'progress': 10
+                })
             
             # Verwende neue Provider-übergreifende Fetch-Funktion
             if not keyword_str:
@@ -1258,19 +1988,20 @@ class UltimateJobHunter:
             
             all_jobs = self.fetch_jobs_from_providers(keyword_str, max_jobs, max_age_days, location=location, include_remote=include_remote, profile_name=profile_name)
             
-            # Progress update nach Job-Sammlung
-            self.emit_json_event('stage_change', {
-                'stage': 'Jobsuche abgeschlossen',
-                'message': f'{len(all_jobs)} Jobs von allen Providern gefunden',
-                'progress': 40
-            })
-            
-            # Schritt 2: Jobs ranken
-            self.emit_json_event('stage_change', {
-                'stage': 'Ranking',
-                'message': f'Bewerte und ranke {len(all_jobs)} gefundene Jobs...',
-                'progress': 45
-            })
+            with self.batched_json_events():
+                # Progress update nach Job-Sammlung
+                self.emit_json_event('stage_change', {
+                    'stage': 'Jobsuche abgeschlossen',
+                    'message': f'{len(all_jobs)} Jobs von allen Providern gefunden',
+                    'progress': 40
+                })
+                
+                # Schritt 2: Jobs ranken
+                self.emit_json_event('stage_change', {
+                    'stage': 'Ranking',
+                    'message': f'Bewerte und ranke {len(all_jobs)} gefundene Jobs...',
+                    'progress': 45
+                })
             
             # Check for cancellation before ranking
             if self.check_cancellation():
@@ -1327,78 +2058,79 @@ class UltimateJobHunter:
             generated_count = 0  # tatsächlich gespeicherte Bewerbungen
             finalized_apps: List[Dict[str, Any]] = []
             app_lookup = {app['job_id']: app for app in applications}
+            batch_now_iso = datetime.now().isoformat()  # ein Zeitstempel für alle Approvals
+
+            # Drafts aller Approvals in einer draft_storage-Transaktion speichern
+            with draft_batch():
+                for entry in approved_jobs:
+                    # Eintrag kann entweder int (Legacy) oder Dict sein
+                    if isinstance(entry, dict):
+                        job_id = entry.get('job_id')
+                        updated_text = entry.get('application_text')
+                        sender_address = entry.get('sender_address')
+                        company_address = entry.get('company_address')
+                        force_pdf = bool(entry.get('force_pdf'))
+                    else:
+                        job_id = entry
+                        updated_text = None
+                        sender_address = None
+                        company_address = None
+                        force_pdf = False
 
-            for entry in approved_jobs:
-                # Eintrag kann entweder int (Legacy) oder Dict sein
-                if isinstance(entry, dict):
-                    job_id = entry.get('job_id')
-                    updated_text = entry.get('application_text')
-                    sender_address = entry.get('sender_address')
-                    company_address = entry.get('company_address')
-                    force_pdf = bool(entry.get('force_pdf'))
-                else:
-                    job_id = entry
-                    updated_text = None
-                    sender_address = None
-                    company_address = None
-                    force_pdf = False
-
-                if not job_id:
-                    continue
-
-                app_data = app_lookup.get(job_id)
+                    if not job_id:
+                        continue
 
-                # Jetzt erst - nach Approval - Dateien schreiben 📂
-                if app_data:
-                    try:
-                        # Verwende Aktualisierungen des Users, falls vorhanden
-                        final_text = updated_text or app_data['application_text']
-
-                        # Prepare job data with user-provided addresses
-                        final_job_data = app_data.copy()
-                        if company_address and company_address.strip():
-                            # User provided company address - add to job data
-                            final_job_data['user_company_address'] = company_address.strip()
-                        if sender_address and sender_address.strip():
-                            # User provided sender address - add to job data  
-                            final_job_data['user_sender_address'] = sender_address.strip()
-
-                        # Erzeuge Dateinamen & speichere
-                        save_info = self.save_application(
-                            final_text,
-                            app_data['company'],
-                            app_data['filename'],
-                            final_job_data
-                        )
+                    app_data = app_lookup.get(job_id)
 
-                        # Merge Save-Info zurück in dict
-                        app_data.update(save_info)
-                        generated_count += 1
-                        
-                        # Save to draft database for future editing
+                    # Jetzt erst - nach Approval - Dateien schreiben 📂
+                    if app_data:
                         try:
-                            from draft_storage import create_draft
-                            job_info = {'company': app_data['company'], 'title': app_data['job_title']}
-                            create_draft(job_info, final_text)
-                            print(f"✅ Draft saved for {app_data['company']} - {app_data['job_title']}")
-                        except Exception as draft_err:
-                            print(f"⚠️ Draft saving failed: {draft_err}")
-                            # Log detailed error for debugging
-                            import traceback
-                            print(f"⚠️ Draft error details: {traceback.format_exc()}")
+                            # Verwende Aktualisierungen des Users, falls vorhanden
+                            final_text = updated_text or app_data['application_text']
+
+                            # Prepare job data with user-provided addresses
+                            final_job_data = app_data.copy()
+                            if company_address and company_address.strip():
+                                # User provided company address - add to job data
+                                final_job_data['user_company_address'] = company_address.strip()
+                            if sender_address and sender_address.strip():
+                                # User provided sender address - add to job data  
+                                final_job_data['user_sender_address'] = sender_address.strip()
+
+                            # Erzeuge Dateinamen & speichere
+                            save_info = self.save_application(
+                                final_text,
+                                app_data['company'],
+                                app_data['filename'],
+                                final_job_data
+                            )
+
+                            # Merge Save-Info zurück in dict
+                            app_data.update(save_info)
+                            generated_count += 1
+                        
+                            # Save to draft database for future editing
+                            try:
+                                from draft_storage import create_draft
+                                job_info = {'company': app_data['company'], 'title': app_data['job_title']}
+                                create_draft(job_info, final_text)
+                                print(f"✅ Draft saved for {app_data['company']} - {app_data['job_title']}")
+                            except Exception as draft_err:
+                                print(f"⚠️ Draft saving failed: {draft_err}")
+                                logger.debug("Draft saving failed", exc_info=True)
                         
-                        finalized_apps.append({
-                            'job_id': job_id,
-                            'company': app_data['company'],
-                            'job_title': app_data['job_title'],
-                            'pdf_path': save_info.get('pdf_path'),
-                            'txt_path': save_info.get('txt_path')
-                        })
-                    except Exception as save_err:
-                        print(f"❌ Speichern nach Approval fehlgeschlagen für Job {job_id}: {save_err}")
-
-                if self.mark_job_as_completed(job_id, user_approved=True):
-                    finalized_count += 1
+                            finalized_apps.append({
+                                'job_id': job_id,
+                                'company': app_data['company'],
+                                'job_title': app_data['job_title'],
+                                'pdf_path': save_info.get('pdf_path'),
+                                'txt_path': save_info.get('txt_path')
+                            })
+                        except Exception as save_err:
+                            print(f"❌ Speichern nach Approval fehlgeschlagen für Job {job_id}: {save_err}")
+
+                    if self.mark_job_as_completed(job_id, user_approved=True, now_iso=batch_now_iso):
+                        finalized_count += 1
             
             self.emit_json_event('final_results', {
                 'message': f'Interactive Workflow abgeschlossen! {finalized_count} Bewerbungen finalisiert.',
@@ -1425,8 +2157,6 @@ class UltimateJobHunter:
 
     # Refactored implementation (prefixed with underscore to avoid recursion)
     def _process_selected_jobs_impl(self, selected_job_ids, ranked_jobs, save_files: bool, search_addresses: bool = False):
-        applications = []
-
         # Finde ausgewählte Jobs
         selected_id_set = {int(jid) for jid in selected_job_ids}
         selected_jobs = [job for job in ranked_jobs if int(job['id']) in selected_id_set]
@@ -1437,173 +2167,181 @@ class UltimateJobHunter:
             'progress': 60
         })
 
-        for i, job in enumerate(selected_jobs):
-            try:
-                application_text = self.generate_application(job)
-
-                company_clean = clean_company_name_string(job['company'])
-                raw_title = job.get('title') or job.get('position') or 'Bewerbung'
-                position_clean = clean_job_title_string(raw_title) if raw_title else 'Bewerbung'
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"Bewerbung als {position_clean}_{timestamp}.txt"
-
-                if save_files:
-                    save_info = self.save_application(application_text, job['company'], filename, job)
-                elif search_addresses:
-                    # Nur Adress-Suche durchführen ohne Dateien zu speichern
-                    print(f"🔍 Searching address for {job['company']} (for frontend display)")
+        # Entwürfe parallel erstellen (LLM, Adresssuche und PDF warten auf Netzwerk/Platte);
+        # Reihenfolge und fortlaufender Fortschritt bleiben wie im seriellen Loop
+        results = [None] * len(selected_jobs)
+        if selected_jobs:
+            with ThreadPoolExecutor(max_workers=min(len(selected_jobs), 8)) as executor:
+                futures = {
+                    executor.submit(self._build_selected_application, job, save_files, search_addresses,
+                                    len(selected_jobs) > 1): i
+                    for i, job in enumerate(selected_jobs)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
                     try:
-                        address_result = self.bewerbungshelfer.find_company_address(
-                            job['company'], 
-                            job.get('description', ''),
-                            job
-                        )
-                        
-                        # Extract address from result
-                        if isinstance(address_result, dict):
-                            street = address_result.get('street', '')
-                            city = address_result.get('city', '') 
-                            postal_code = address_result.get('postal_code', '')
-                            if street and city:
-                                found_address = f"{street}, {postal_code} {city}" if postal_code else f"{street}, {city}"
-                            else:
-                                found_address = ""
-                            
-                            # 🔧 FIXED: Preserve complete address_info including street_lines for PDF formatting
-                            address_info = address_result.copy()
-                            address_info['search_performed'] = True
-                        else:
-                            found_address = str(address_result) if address_result else ""
-                            address_info = {'search_performed': True, 'method': 'fallback_string'}
-                        
-                        address_available = bool(found_address and found_address != "Nicht verfügbar")
-                        save_info = {
-                            'txt_path': '', 
-                            'pdf_path': None,
-                            'found_address': found_address or '',
-                            'address_info': address_info,
-                            'address_available': address_available
-                        }
-                        print(f"✅ Address search result: {found_address} (available: {address_available})")
+                        results[i] = future.result()
                     except Exception as e:
-                        print(f"❌ Address search failed: {e}")
-                        save_info = {
-                            'txt_path': '', 
-                            'pdf_path': None,
-                            'found_address': '',
-                            'address_info': {'search_performed': True, 'error': str(e)},
-                            'address_available': False
-                        }
-                else:
-                    save_info = {'txt_path': '', 'pdf_path': None}
+                        print(f"   ❌ Fehler bei Job {selected_jobs[i]['id']}: {str(e)}")
+                    
+                    progress = 60 + int((done / max(1, len(selected_jobs))) * (10 if save_files else 5))
+                    self.emit_json_event('stage_change', {
+                        'stage': 'Bewerbungserstellung',
+                        'message': f'{done}/{len(selected_jobs)} Entwürfe generiert',
+                        'progress': progress
+                    })
+        
+        applications = [application for application in results if application is not None]
+        return applications
 
-                application_data = {
-                    **save_info,
-                    'job_id': int(job['id']),
-                    'job_title': job['title'],
-                    'company': job['company'],
-                    'application_text': application_text,
-                    'filename': filename,
-                    'file_path': save_info.get('txt_path', ''),
-                    'found_address': save_info.get('found_address', ''),
-                    'address_info': save_info.get('address_info', {}),
-                    'address_available': save_info.get('address_available', False)
-                }
+    def _build_selected_application(self, job, save_files: bool, search_addresses: bool, pdf_in_pool: bool = False):
+        """Ein Entwurf für _process_selected_jobs_impl (läuft in einem Worker-Thread)
 
-                applications.append(application_data)
+        Mit pdf_in_pool rendert save_application das PDF im Prozess-Pool, damit die
+        PDFs mehrerer Jobs nicht nacheinander am GIL hängen.
+        """
+        application_text = self.generate_application(job)
 
-                progress = 60 + int(((i + 1) / max(1, len(selected_jobs))) * (10 if save_files else 5))
-                self.emit_json_event('stage_change', {
-                    'stage': 'Bewerbungserstellung',
-                    'message': f'{i+1}/{len(selected_jobs)} Entwürfe generiert',
-                    'progress': progress
-                })
+        raw_title = job.get('title') or job.get('position') or 'Bewerbung'
+        position_clean = clean_job_title_string(raw_title) if raw_title else 'Bewerbung'
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"Bewerbung als {position_clean}_{timestamp}.txt"
+
+        if save_files:
+            save_info = self.save_application(application_text, job['company'], filename, job, pdf_in_pool=pdf_in_pool)
+        elif search_addresses:
+            # Nur Adress-Suche durchführen ohne Dateien zu speichern
+            print(f"🔍 Searching address for {job['company']} (for frontend display)")
+            try:
+                address_result = self.bewerbungshelfer.find_company_address(
+                    job['company'], 
+                    job.get('description', ''),
+                    job
+                )
+                
+                # Extract address from result
+                if isinstance(address_result, dict):
+                    street = address_result.get('street', '')
+                    city = address_result.get('city', '') 
+                    postal_code = address_result.get('postal_code', '')
+                    if street and city:
+                        found_address = f"{street}, {postal_code} {city}" if postal_code else f"{street}, {city}"
+                    else:
+                        found_address = ""
+                    
+                    # 🔧 FIXED: Preserve complete address_info including street_lines for PDF formatting
+                    address_info = address_result.copy()
+                    address_info['search_performed'] = True
+                else:
+                    found_address = str(address_result) if address_result else ""
+                    address_info = {'search_performed': True, 'method': 'fallback_string'}
+                
+                address_available = bool(found_address and found_address != "Nicht verfügbar")
+                save_info = {
+                    'txt_path': '', 
+                    'pdf_path': None,
+                    'found_address': found_address or '',
+                    'address_info': address_info,
+                    'address_available': address_available
+                }
+                print(f"✅ Address search result: {found_address} (available: {address_available})")
             except Exception as e:
-                print(f"   ❌ Fehler bei Job {job['id']}: {str(e)}")
-                continue
-        return applications
+                print(f"❌ Address search failed: {e}")
+                save_info = {
+                    'txt_path': '', 
+                    'pdf_path': None,
+                    'found_address': '',
+                    'address_info': {'search_performed': True, 'error': str(e)},
+                    'address_available': False
+                }
+        else:
+            save_info = {'txt_path': '', 'pdf_path': None, 'found_address': '',
+                         'address_info': {}, 'address_available': False}
+
+        # Jeder Zweig liefert found_address/address_info/address_available schon in save_info
+        application_data = {
+            **save_info,
+            'job_id': int(job['id']),
+            'job_title': job['title'],
+            'company': job['company'],
+            'application_text': application_text,
+            'filename': filename,
+            'file_path': save_info['txt_path']
+        }
 
-    def wait_for_job_selection(self):
-        """🎯 Warte auf Job-Auswahl vom User via HTTP"""
-        import requests
-        import time
-        
-        print("   ⏳ Warte auf Job-Auswahl via HTTP...")
-        
-        timeout = 300  # 5 minutes
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+        return application_data
+
+    def _wait_for_handoff(self, path, expected_type, timeout=300):
+        """Long-poll the draft API hand-off at *path* for an *expected_type* or 'cancel' entry
+
+        Returns the entry's data dict, or None on timeout or process cancellation. Each
+        GET waits server-side (``?wait=``) until the GUI posts, so the answer arrives
+        immediately instead of on the next 1s poll; cancellation is checked between polls.
+        """
+        # The GUI can only answer what it has seen
+        self.flush_json_events()
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            wait = min(remaining, _HANDOFF_POLL_SECONDS)
+            started = time.monotonic()
             try:
-                # Check for job selection data from HTTP API
-                response = requests.get('http://localhost:8000/job-selection', timeout=1)
-                
+                response = self._handoff_session.get(f"{DRAFT_API_URL}{path}", params={'wait': wait}, timeout=wait + 5)
                 if response.status_code == 200:
                     data = response.json()
-                    if data.get('type') == 'job_selection':
-                        job_ids = data.get('selected_job_ids', [])
-                        print(f"   ✅ Job-Auswahl über HTTP erhalten: {job_ids}")
-                        return job_ids
-                    elif data.get('type') == 'cancel':
-                        print("   ❌ Abbruch über HTTP erhalten")
-                        return []
-                        
+                    if data.get('type') in (expected_type, 'cancel'):
+                        return data
             except requests.exceptions.RequestException:
                 # API not ready or no data yet, continue waiting
                 pass
             except Exception as e:
                 print(f"   ❌ HTTP-Fehler: {e}")
-                
+            
             # Check for cancellation
             if self.check_cancellation():
                 print("   ❌ Prozess abgebrochen")
-                return []
-                
-            time.sleep(1)  # Check every second
+                return None
+            
+            # API down, or an older API without long-poll support: don't spin
+            idle = 1 - (time.monotonic() - started)
+            if idle > 0:
+                time.sleep(idle)
+
+    def wait_for_job_selection(self):
+        """🎯 Warte auf Job-Auswahl vom User via HTTP"""
+        print("   ⏳ Warte auf Job-Auswahl via HTTP...")
         
-        print("   ⏰ Timeout - keine Auswahl erhalten")
-        return []
+        data = self._wait_for_handoff('/job-selection', 'job_selection')
+        if data is None:
+            if not self.cancel_event.is_set():
+                print("   ⏰ Timeout - keine Auswahl erhalten")
+            return []
+        if data['type'] == 'cancel':
+            print("   ❌ Abbruch über HTTP erhalten")
+            return []
+        
+        job_ids = data.get('selected_job_ids', [])
+        print(f"   ✅ Job-Auswahl über HTTP erhalten: {job_ids}")
+        return job_ids
 
     def wait_for_application_approval(self):
         """🎯 Warte auf Bewerbungs-Genehmigung vom User via HTTP"""
-        import requests
-        import time
-        
         print("   ⏳ Warte auf Bewerbungs-Genehmigung via HTTP...")
         
-        timeout = 300  # 5 minutes
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            try:
-                # Check for application approval data from HTTP API
-                response = requests.get('http://localhost:8000/application-approval', timeout=1)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('type') == 'application_approval':
-                        approved_apps = data.get('approved_applications', [])
-                        print(f"   ✅ Bewerbungs-Genehmigung über HTTP erhalten: {len(approved_apps)} Bewerbungen")
-                        return approved_apps
-                    elif data.get('type') == 'cancel':
-                        print("   ❌ Abbruch über HTTP erhalten")
-                        return []
-                        
-            except requests.exceptions.RequestException:
-                # API not ready or no data yet, continue waiting
-                pass
-            except Exception as e:
-                print(f"   ❌ HTTP-Fehler: {e}")
-                
-            # Check for cancellation
-            if self.check_cancellation():
-                print("   ❌ Prozess abgebrochen")
-                return []
-                
-            time.sleep(1)  # Check every second
+        data = self._wait_for_handoff('/application-approval', 'application_approval')
+        if data is None:
+            if not self.cancel_event.is_set():
+                print("   ⏰ Timeout - keine Genehmigung erhalten")
+            return []
+        if data['type'] == 'cancel':
+            print("   ❌ Abbruch über HTTP erhalten")
+            return []
         
-        print("   ⏰ Timeout - keine Genehmigung erhalten")
-        return []
+        approved_apps = data.get('approved_applications', [])
+        print(f"   ✅ Bewerbungs-Genehmigung über HTTP erhalten: {len(approved_apps)} Bewerbungen")
+        return approved_apps
 
     # =========================================
     # 🔄 JSON Event Emitter (für GUI-Integration)
@@ -1623,11 +2361,57 @@ class UltimateJobHunter:
             payload.update(data)
 
         try:
-            sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
-            sys.stdout.flush()
+            line = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
         except Exception as e:
             # Fallback: einfache Print-Ausgabe
             print(f"⚠️ emit_json_event failed: {e}")
+            return
+
+        # Outside batched_json_events() the event goes out now: the GUI must see progress
+        # before whatever blocking step follows the emit
+        with self._event_lock:
+            self._event_buf.append(line)
+            flush_now = (not self._event_batch_depth
+                         or event_type in _EVENT_FLUSH_TYPES
+                         or len(self._event_buf) >= _EVENT_BUFFER_MAX)
+        if flush_now:
+            self.flush_json_events()
+
+    @contextlib.contextmanager
+    def batched_json_events(self):
+        """Events emitted in this block are written with one write + flush when it ends.
+
+        Only for emits that follow each other directly - nothing blocking inside the block.
+        """
+        with self._event_lock:
+            self._event_batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._event_lock:
+                self._event_batch_depth -= 1
+            self.flush_json_events()
+
+    def flush_json_events(self):
+        """Schreibt gepufferte JSON-Events in einem Rutsch nach stdout."""
+        with self._event_lock:
+            if not self._event_buf:
+                return
+            data = b''.join(self._event_buf)
+            self._event_buf.clear()
+            try:
+                stream = getattr(sys.stdout, 'buffer', None)
+                if stream is None:
+                    # stdout replaced by a text-only stream
+                    sys.stdout.write(data.decode('utf-8'))
+                    sys.stdout.flush()
+                else:
+                    # Pending print() output goes first, then the UTF-8 bytes pass straight through
+                    sys.stdout.flush()
+                    stream.write(data)
+                    stream.flush()
+            except Exception as e:
+                print(f"⚠️ emit_json_event failed: {e}")
 
     # =========================================
     # 💌 Bewerbung generieren & speichern
@@ -1675,19 +2459,19 @@ class UltimateJobHunter:
             raise Exception("AI-Bewerbungsgenerierung fehlgeschlagen. Kein Fallback-Template verfügbar.")
         return anschreiben.strip()
 
-    def save_application(self, application_text: str, company: str, filename: str, job: dict) -> dict:
+    def save_application(self, application_text: str, company: str, filename: str, job: dict,
+                         pdf_in_pool: bool = False) -> dict:
         """Speichere Anschreiben als PDF wenn Adresse vorhanden, sonst nur als TXT.
 
         • Hat die Bewerbungshelfer-Komponente eine gültige Adresse → PDF + TXT
         • Fehlt die Anschrift → nur TXT-Datei mit Platzhalter für manuelle Adresse
         Rückgabe-Dict enthält:
         { 'pdf_path': <str|None>, 'txt_path': <str>, 'address_info': <dict>, 'found_address': <str>, 'address_available': <bool> }
+        Mit pdf_in_pool wird das PDF in einem Worker-Prozess gerendert (parallele Saves).
         """
         
-        print(f"🎯 save_application CALLED with company: {company}")
-        print(f"🎯 save_application job keys: {list(job.keys()) if job else 'None'}")
-        print(f"🎯 save_application user_company_address: {job.get('user_company_address') if job else 'No job_data'}")
-        print("🔥 MANUAL JOB DEBUG: save_application function definitely called!")
+        logger.debug("save_application: company=%r job keys=%s user_company_address=%r",
+                     company, list(job) if job else None, job.get('user_company_address') if job else None)
         
         safe_company = clean_company_name_string(company)
         folder_name = f"{safe_company}_{datetime.now().strftime('%Y-%m-%d')}"
@@ -1703,21 +2487,12 @@ class UltimateJobHunter:
         txt_file = base_file.with_suffix('.txt')
         pdf_file = base_file.with_suffix('.pdf')
 
-        # ✨ Stelle sicher, dass keine Datei überschrieben wird
-        version = 1
-        while txt_file.exists() or pdf_file.exists():
-            version += 1
-            base_file = folder_path / f"Bewerbung als {position_safe}_{timestamp}_v{version}"
-            txt_file = base_file.with_suffix('.txt')
-            pdf_file = base_file.with_suffix('.pdf')
-
         # Check if user provided addresses, otherwise search automatically
         user_company_address = job.get('user_company_address')
         user_sender_address = job.get('user_sender_address')
         
         if user_company_address and user_company_address.strip():
             # 🎯 ENHANCED: Smart Address Parsing for user-provided addresses
-            import re
             address_lines = user_company_address.strip().split('\n')
             
             # Initialize address_info with defaults
@@ -1742,32 +2517,27 @@ class UltimateJobHunter:
                         address_info['street'] = parts[0].strip()
                         # Try to extract PLZ and city from remaining parts
                         remaining = ', '.join(parts[1:])
-                        print(f"   🔍 PARSE DEBUG: single_line='{single_line}'")
-                        print(f"   🔍 PARSE DEBUG: parts={parts}")
-                        print(f"   🔍 PARSE DEBUG: remaining='{remaining}'")
-                        plz_city_match = re.search(r'(\d{5})\s+([A-ZÄÖÜ][a-zäöüß\-\s]+?)(?:,|$)', remaining)
-                        print(f"   🔍 PARSE DEBUG: plz_city_match={plz_city_match}")
+                        plz_city_match = _PLZ_CITY_COMMA_RE.search(remaining)
                         if plz_city_match:
                             address_info['postal_code'] = plz_city_match.group(1)
                             address_info['city'] = plz_city_match.group(2).strip()
-                            print(f"   🔧 USER ADDRESS (comma format): Street: '{address_info['street']}', PLZ: '{address_info['postal_code']}', City: '{address_info['city']}'")
-                        else:
-                            print(f"   ⚠️ PARSE DEBUG: Regex failed to match remaining part: '{remaining}'")
+                            logger.debug("USER ADDRESS (comma format): street=%r plz=%r city=%r",
+                                         address_info['street'], address_info['postal_code'], address_info['city'])
                 
                 # FORMAT 2: "Street HouseNumber PLZ City" (without comma)
                 if not address_info['street'] and not address_info['city']:
-                    no_comma_pattern = r'^(.+?\s+\d+[a-z]?)\s+(\d{5})\s+(.+)$'
-                    no_comma_match = re.search(no_comma_pattern, single_line)
+                    no_comma_match = _NO_COMMA_ADDRESS_RE.search(single_line)
                     if no_comma_match:
                         address_info['street'] = no_comma_match.group(1).strip()
                         address_info['postal_code'] = no_comma_match.group(2).strip()
                         address_info['city'] = no_comma_match.group(3).strip()
-                        print(f"   🔧 USER ADDRESS (no-comma format): Street: '{address_info['street']}', PLZ: '{address_info['postal_code']}', City: '{address_info['city']}'")
+                        logger.debug("USER ADDRESS (no-comma format): street=%r plz=%r city=%r",
+                                     address_info['street'], address_info['postal_code'], address_info['city'])
                 
                 # FALLBACK: If parsing fails, store as street only
                 if not address_info['street'] and not address_info['city']:
                     address_info['street'] = single_line
-                    print(f"   ⚠️ USER ADDRESS: Could not parse, stored as street: '{single_line}'")
+                    logger.debug("USER ADDRESS: could not parse, stored as street: %r", single_line)
             
             else:
                 # Multi-line input - use lines as components
@@ -1777,7 +2547,7 @@ class UltimateJobHunter:
                 if len(address_lines) >= 2:
                     # Try to parse "PLZ City" format
                     second_line = address_lines[1].strip()
-                    plz_city_match = re.search(r'(\d{5})\s+(.+)', second_line)
+                    plz_city_match = _PLZ_CITY_LINE_RE.search(second_line)
                     if plz_city_match:
                         address_info['postal_code'] = plz_city_match.group(1)
                         address_info['city'] = plz_city_match.group(2).strip()
@@ -1785,7 +2555,8 @@ class UltimateJobHunter:
                         # If no PLZ pattern, treat as city
                         address_info['city'] = second_line
                 
-                print(f"   🔧 USER ADDRESS (multi-line): Street: '{address_info['street']}', PLZ: '{address_info['postal_code']}', City: '{address_info['city']}'")
+                logger.debug("USER ADDRESS (multi-line): street=%r plz=%r city=%r",
+                             address_info['street'], address_info['postal_code'], address_info['city'])
             
             address_present = True
         else:
@@ -1813,6 +2584,25 @@ class UltimateJobHunter:
             
             address_present = self.bewerbungshelfer.should_create_pdf_with_address(address_info)
 
+        # ✨ Stelle sicher, dass keine Datei überschrieben wird: den TXT-Namen atomar belegen
+        # (O_EXCL), damit parallele Saves (_build_selected_application) nie dieselbe Version wählen.
+        # Erst hier, direkt vor PDF/TXT, damit eine fehlschlagende Adresssuche keine Datei hinterlässt.
+        version = 1
+        while True:
+            try:
+                os.close(os.open(txt_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            except FileExistsError:
+                pass
+            else:
+                if not pdf_file.exists():
+                    break
+                txt_file.unlink()  # PDF dieses Namens existiert schon ohne TXT
+            version += 1
+            base_file = folder_path / f"Bewerbung als {position_safe}_{timestamp}_v{version}"
+            txt_file = base_file.with_suffix('.txt')
+            pdf_file = base_file.with_suffix('.pdf')
+
+        txt_written = False
         try:
             # Wenn Adresse fehlt, belassen wir den Brieftext unverändert.
             # Die PDF-Generierungsroutine fügt später - abhängig von der vom Benutzer
@@ -1830,12 +2620,18 @@ class UltimateJobHunter:
                     pdf_job_data['user_sender_address'] = user_sender_address
                 pdf_job_data['address_info'] = address_info
                 
-                ok = self.bewerbungshelfer.create_professional_pdf(
-                    application_text,
-                    str(pdf_file),
-                    job.get('description'),
-                    pdf_job_data
-                )
+                pdf_task = (application_text, str(pdf_file), job.get('description'), pdf_job_data)
+                rendered = False
+                if pdf_in_pool:
+                    pool = _get_pdf_pool()
+                    try:
+                        ok = pool.submit(_render_pdf_worker, *pdf_task).result()
+                        rendered = True
+                    except BrokenProcessPool as e:
+                        print(f"⚠️ PDF-Worker ausgefallen ({e}) - rendere im Hauptprozess")
+                        _discard_pdf_pool(pool)
+                if not rendered:
+                    ok = self._render_pdf_in_process(pdf_task)
                 if ok:
                     pdf_path_str = str(pdf_file)
 
@@ -1848,93 +2644,34 @@ class UltimateJobHunter:
                 )
                 
                 # 🎯 POST-PROCESSING: Fix address layout for user-provided addresses
-                print(f"🔍 POST-PROCESS DEBUG: user_company_address = '{job.get('user_company_address')}'")
-                print(f"🔍 POST-PROCESS DEBUG: address_info = {address_info}")
-                print(f"🔍 POST-PROCESS DEBUG: address_info.get('street') = '{address_info.get('street') if address_info else 'No address_info'}'")
-                print(f"🔍 POST-PROCESS DEBUG: address_info.get('city') = '{address_info.get('city') if address_info else 'No address_info'}'")
-                
                 if job.get('user_company_address') and job.get('user_company_address').strip():
-                    print("🔍 POST-PROCESS DEBUG: User address found, proceeding with comprehensive parsing")
                     user_address_single_line = job.get('user_company_address').strip()
                     
-                    # COMPREHENSIVE ADDRESS PARSING for post-processing
-                    import re
-                    street = ''
-                    postal_code = ''
-                    city = ''
-                    
-                    # Try to use already parsed components first
+                    # Use the components parsed above, otherwise split the single line
                     if address_info and address_info.get('street') and address_info.get('city'):
-                        street = address_info.get('street')
-                        postal_code = address_info.get('postal_code', '')
-                        city = address_info.get('city')
-                        print(f"🔍 POST-PROCESS DEBUG: Using pre-parsed components")
+                        address_replacement = _din5008_address_block(
+                            address_info['street'], address_info.get('postal_code', ''), address_info['city']
+                        )
                     else:
-                        # Parse address manually in post-processing
-                        print(f"🔍 POST-PROCESS DEBUG: Parsing address manually: '{user_address_single_line}'")
-                        
-                        # FORMAT 1: "Street, PLZ City" (with comma)
-                        if ',' in user_address_single_line:
-                            parts = [part.strip() for part in user_address_single_line.split(',')]
-                            if len(parts) >= 2:
-                                street = parts[0].strip()
-                                remaining = parts[1].strip()
-                                # Extract PLZ and city from remaining part
-                                plz_city_match = re.match(r'(\d{4,5})\s+(.+)', remaining)
-                                if plz_city_match:
-                                    postal_code = plz_city_match.group(1)
-                                    city = plz_city_match.group(2).strip()
-                                    print(f"🔍 POST-PROCESS DEBUG: Comma format parsed - Street: '{street}', PLZ: '{postal_code}', City: '{city}'")
-                        
-                        # FORMAT 2: "Street HouseNumber PLZ City" (without comma)
-                        if not street and not city:
-                            parts = user_address_single_line.split()
-                            plz_index = None
-                            for i, part in enumerate(parts):
-                                if re.match(r'^\d{4,5}$', part):
-                                    plz_index = i
-                                    break
-                            
-                            if plz_index is not None and plz_index > 0:
-                                street = ' '.join(parts[:plz_index])
-                                postal_code = parts[plz_index]
-                                city = ' '.join(parts[plz_index + 1:]) if plz_index + 1 < len(parts) else ''
-                                print(f"🔍 POST-PROCESS DEBUG: No-comma format parsed - Street: '{street}', PLZ: '{postal_code}', City: '{city}'")
+                        address_replacement = _din5008_address_block(*_split_single_line_address(user_address_single_line))
                     
-                    # Create DIN 5008 replacement if we have the components
-                    if street and (city or postal_code):
-                        if postal_code and city:
-                            address_replacement = f"{street}\n{postal_code} {city}"
-                        elif city:
-                            address_replacement = f"{street}\n{city}"
-                        else:
-                            address_replacement = f"{street}\n{postal_code}"
-                        
-                        print(f"🔍 POST-PROCESS DEBUG: Looking for '{user_address_single_line}' in txt_content")
-                        print(f"🔍 POST-PROCESS DEBUG: Will replace with '{address_replacement}'")
-                        print(f"🔍 POST-PROCESS DEBUG: txt_content length: {len(txt_content)}")
-                        
-                        # Replace in txt_content
-                        if user_address_single_line in txt_content:
-                            txt_content = txt_content.replace(user_address_single_line, address_replacement)
-                            print(f"   🔧 POST-PROCESSING: Fixed address layout - '{user_address_single_line}' → DIN 5008 format")
-                        else:
-                            print(f"   ⚠️ POST-PROCESSING: Could not find '{user_address_single_line}' in txt_content")
-                            # Try a partial search to see what's in the txt_content
-                            lines = txt_content.split('\n')
-                            for i, line in enumerate(lines[:20]):  # Check first 20 lines
-                                if any(word in line for word in user_address_single_line.split()[:2]):  # Check first 2 words
-                                    print(f"   🔍 POST-PROCESS DEBUG: Possible address line {i}: '{line}'")
-                    else:
-                        print("🔍 POST-PROCESS DEBUG: Could not parse address components, skipping post-processing")
-                else:
-                    print("🔍 POST-PROCESS DEBUG: No user address found, skipping post-processing")
+                    # Replace in txt_content
+                    if address_replacement and user_address_single_line in txt_content:
+                        txt_content = txt_content.replace(user_address_single_line, address_replacement)
+                        logger.debug("POST-PROCESSING: %r -> DIN 5008 address block", user_address_single_line)
+                    elif address_replacement:
+                        logger.debug("POST-PROCESSING: %r not found in txt_content", user_address_single_line)
                 
                 txt_file.write_text(txt_content, encoding='utf-8')
+                txt_written = True
             except Exception as txt_err:
                 print(f"❌ TXT-Schreibfehler: {txt_err}")
         except Exception as e:
             print(f"❌ Fehler bei PDF-Erstellung: {e}")
+        finally:
+            if not txt_written:
+                # Den belegten, noch leeren Namen nicht liegen lassen
+                txt_file.unlink(missing_ok=True)
  
         # Create full_address from address_info components
         full_address = ''
@@ -1951,69 +2688,29 @@ class UltimateJobHunter:
         # 🛠️ FINAL FALLBACK FIX: Ensure TXT file has proper DIN 5008 address formatting
         # This runs regardless of which code path was used to create the TXT file
         if txt_file.exists() and job.get('user_company_address'):
-            print(f"🔧 FINAL FALLBACK: Checking TXT file for address formatting")
             try:
                 current_content = txt_file.read_text(encoding='utf-8')
                 user_address = job.get('user_company_address').strip()
                 
                 # Check if the address is in single-line format and needs fixing
                 if user_address in current_content:
-                    print(f"🔧 FINAL FALLBACK: Found single-line address '{user_address}' in TXT file")
-                    
-                    # Parse and fix the address
-                    import re
-                    street = ''
-                    postal_code = ''
-                    city = ''
-                    
-                    # FORMAT 1: "Street, PLZ City" (with comma)
-                    if ',' in user_address:
-                        parts = [part.strip() for part in user_address.split(',')]
-                        if len(parts) >= 2:
-                            street = parts[0].strip()
-                            remaining = parts[1].strip()
-                            plz_city_match = re.match(r'(\d{4,5})\s+(.+)', remaining)
-                            if plz_city_match:
-                                postal_code = plz_city_match.group(1)
-                                city = plz_city_match.group(2).strip()
-                    
-                    # FORMAT 2: "Street HouseNumber PLZ City" (without comma)
-                    if not street and not city:
-                        parts = user_address.split()
-                        plz_index = None
-                        for i, part in enumerate(parts):
-                            if re.match(r'^\d{4,5}$', part):
-                                plz_index = i
-                                break
-                        
-                        if plz_index is not None and plz_index > 0:
-                            street = ' '.join(parts[:plz_index])
-                            postal_code = parts[plz_index]
-                            city = ' '.join(parts[plz_index + 1:]) if plz_index + 1 < len(parts) else ''
-                    
-                    # Apply DIN 5008 formatting if we parsed successfully
-                    if street and (city or postal_code):
-                        if postal_code and city:
-                            din5008_address = f"{street}\n{postal_code} {city}"
-                        elif city:
-                            din5008_address = f"{street}\n{city}"
-                        else:
-                            din5008_address = f"{street}\n{postal_code}"
-                        
+                    # Parse and fix the address, applying DIN 5008 formatting if that succeeds
+                    din5008_address = _din5008_address_block(*_split_single_line_address(user_address))
+                    if din5008_address:
                         # Replace and save the fixed content
                         fixed_content = current_content.replace(user_address, din5008_address)
                         txt_file.write_text(fixed_content, encoding='utf-8')
-                        print(f"🔧 FINAL FALLBACK: Fixed TXT file address format - '{user_address}' → DIN 5008")
+                        logger.debug("FINAL FALLBACK: %r -> DIN 5008 address block", user_address)
                     else:
-                        print(f"🔧 FINAL FALLBACK: Could not parse address '{user_address}'")
+                        logger.debug("FINAL FALLBACK: could not parse address %r", user_address)
                 else:
-                    print(f"🔧 FINAL FALLBACK: Address '{user_address}' not found in TXT content")
-            except Exception as fallback_err:
-                print(f"🔧 FINAL FALLBACK: Error during TXT fix: {fallback_err}")
+                    logger.debug("FINAL FALLBACK: address %r not found in TXT content", user_address)
+            except Exception:
+                logger.exception("FINAL FALLBACK: TXT address fix failed")
 
         # ✅ Return save information
         return {
-            'txt_path': str(txt_file),
+            'txt_path': str(txt_file) if txt_written else '',
             'pdf_path': pdf_path_str,
             'address_info': address_info,
             'found_address': full_address,
@@ -2313,7 +3010,6 @@ class UltimateJobHunter:
                         return float(salary_value)
                     elif isinstance(salary_value, str):
                         # Try to extract number from string
-                        import re
                         numbers = re.findall(r'\d+', salary_value.replace(',', ''))
                         if numbers:
                             return float(numbers[0])
@@ -2438,9 +3134,6 @@ class UltimateJobHunter:
         Returns:
             Dictionary with generated application data for preview
         """
-        import re
-        import uuid
-        from datetime import datetime
         
         try:
             self.emit_json_event('manual_processing_started', {
@@ -2643,9 +3336,6 @@ class UltimateJobHunter:
         Returns:
             Dictionary with processing results and application data
         """
-        import re
-        import uuid
-        from datetime import datetime
         
         try:
             self.emit_json_event('manual_processing_started', {
@@ -2846,81 +3536,36 @@ class UltimateJobHunter:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Clean filename
-            from job_utils import clean_job_title_string, clean_company_name_string
             position_clean = clean_job_title_string(job_title)
             company_clean = clean_company_name_string(company_name)
             
             # 📁 Create application folder structure (like normal job processing)
-            from pathlib import Path
             folder_name = company_clean if company_clean else f"ManualJob_{timestamp}"
             folder_path = Path("applications") / f"{folder_name}_{datetime.now().strftime('%Y-%m-%d')}"
             folder_path.mkdir(parents=True, exist_ok=True)
             
             # File paths - sanitize filename for filesystem compatibility
-            from job_utils import clean_filename_string
             position_safe = clean_filename_string(position_clean)  # Use proper sanitization function
             txt_file = folder_path / f"Bewerbung als {position_safe}_{timestamp}.txt"
             pdf_file = folder_path / f"Bewerbung als {position_safe}_{timestamp}.pdf"
             
             # Save application text immediately with proper DIN 5008 address formatting
-            print(f"🔧 MANUAL JOB DEBUG: Creating TXT file with address formatting")
-            print(f"🔧 MANUAL JOB DEBUG: company_address = '{company_address}'")
+            logger.debug("MANUAL JOB: creating TXT file, company_address=%r", company_address)
             
             # Apply DIN 5008 address formatting if company address is available
             formatted_application_text = application_text
             if company_address and company_address.strip():
-                print(f"🔧 MANUAL JOB DEBUG: Applying address formatting to manual job TXT")
-                
                 # Parse the address for proper DIN 5008 formatting
-                import re
-                street = ''
-                postal_code = ''
-                city = ''
-                
                 address_line = company_address.strip()
-                
-                # FORMAT 1: "Street, PLZ City" (with comma)
-                if ',' in address_line:
-                    parts = [part.strip() for part in address_line.split(',')]
-                    if len(parts) >= 2:
-                        street = parts[0].strip()
-                        remaining = parts[1].strip()
-                        # Extract PLZ and city from remaining part
-                        plz_city_match = re.match(r'(\d{4,5})\s+(.+)', remaining)
-                        if plz_city_match:
-                            postal_code = plz_city_match.group(1)
-                            city = plz_city_match.group(2).strip()
-                            print(f"🔧 MANUAL JOB DEBUG: Comma format - Street: '{street}', PLZ: '{postal_code}', City: '{city}'")
-                
-                # FORMAT 2: "Street HouseNumber PLZ City" (without comma)
-                if not street and not city:
-                    parts = address_line.split()
-                    plz_index = None
-                    for i, part in enumerate(parts):
-                        if re.match(r'^\d{4,5}$', part):
-                            plz_index = i
-                            break
-                    
-                    if plz_index is not None and plz_index > 0:
-                        street = ' '.join(parts[:plz_index])
-                        postal_code = parts[plz_index]
-                        city = ' '.join(parts[plz_index + 1:]) if plz_index + 1 < len(parts) else ''
-                        print(f"🔧 MANUAL JOB DEBUG: No-comma format - Street: '{street}', PLZ: '{postal_code}', City: '{city}'")
+                din5008_address = _din5008_address_block(*_split_single_line_address(address_line))
                 
                 # Apply DIN 5008 formatting if we successfully parsed the address
-                if street and (city or postal_code):
-                    if postal_code and city:
-                        din5008_address = f"{street}\n{postal_code} {city}"
-                    elif city:
-                        din5008_address = f"{street}\n{city}"
-                    else:
-                        din5008_address = f"{street}\n{postal_code}"
-                    
+                if din5008_address:
                     # Replace the single-line address with DIN 5008 format
                     formatted_application_text = application_text.replace(address_line, din5008_address)
-                    print(f"🔧 MANUAL JOB DEBUG: Replaced '{address_line}' with DIN 5008 format")
+                    logger.debug("MANUAL JOB: %r -> DIN 5008 address block", address_line)
                 else:
-                    print(f"🔧 MANUAL JOB DEBUG: Could not parse address '{address_line}', using original")
+                    logger.debug("MANUAL JOB: could not parse address %r, using original", address_line)
             
             with open(txt_file, 'w', encoding='utf-8') as f:
                 f.write(formatted_application_text)
@@ -2970,7 +3615,6 @@ class UltimateJobHunter:
             }
             
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             logger.error(f"Manual processing failed: {str(e)}")
             logger.error(f"Full traceback: {error_details}")
@@ -3007,6 +3651,11 @@ def main():
     
     args = parser.parse_args()
     
+    if args.json_output:
+        # Worker threads print while events are written; keep every stdout line whole
+        sys.stdout = _LineAtomicStdout(sys.stdout)
+        atexit.register(sys.stdout.close_pending)
+    
     try:
         # Skip Stepstone für alle Modi
         skip_stepstone = True  # IMMER Stepstone deaktivieren
@@ -3064,7 +3713,6 @@ def main():
         print("\n\n⚠️  Programm wurde vom Benutzer gestoppt")
     except Exception as e:
         print(f"\n❌ Unerwarteter Fehler: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":